@@ -19,9 +19,10 @@ setup(
     ],
     extras_require={
         "dev": [
-            "pytest>=7.4.0",
-            "pytest-asyncio>=0.21.1",
+            "pytest>=8.2",
+            "pytest-asyncio>=0.24.0",
             "pytest-cov>=4.1.0",
+            "pytest-xdist>=3.5.0",
             "ruff>=0.1.0",
         ],
     },
@@ -13,6 +13,9 @@ logger = logging.getLogger(__name__)
 class RoomManager:
     """Manages room tracking and navigation for the MUD agent."""
 
+    # Seconds to wait after an implicit-exit command before checking for a room change
+    FORCE_EXIT_CHECK_DELAY = 2.0
+
     def __init__(self, agent):
         self.agent = agent
         self.events = agent.events
@@ -183,8 +186,8 @@ class RoomManager:
             self.logger.debug(f"Force exit check skipped - no current room for command: {command}")
             return
 
-        self.logger.debug(f"Force exit check: waiting 2s to detect room change after '{command}' from room {from_room_num}")
-        await asyncio.sleep(2.0)
+        self.logger.debug(f"Force exit check: waiting {self.FORCE_EXIT_CHECK_DELAY}s to detect room change after '{command}' from room {from_room_num}")
+        await self._wait_for_room_change()
 
         # Check if the pending command was already handled (cleared) by _on_room_update
         if self.pending_exit_command != command:
@@ -216,6 +219,10 @@ class RoomManager:
             # even if it takes longer than 2 seconds (lag).
             # self.pending_exit_command = None
 
+    async def _wait_for_room_change(self) -> None:
+        """Give the server time to move us after an implicit-exit command."""
+        await asyncio.sleep(self.FORCE_EXIT_CHECK_DELAY)
+
     def _get_direction_from_command(self, command: str) -> str | None:
         """Extracts a direction from a command string."""
         parts = command.lower().split()
@@ -28,13 +28,14 @@ logger = logging.getLogger(__name__)
 # Database configuration
 DB_PATH = Path.cwd() / ".mcp" / "knowledge_graph.db"
 DB_PATH.parent.mkdir(parents=True, exist_ok=True)
+DB_PRAGMAS = {
+    'journal_mode': 'wal',
+    'busy_timeout': 30000,  # Wait up to 30s for locks (SyncWorker may hold writes)
+}
 
 # Always use local SQLite for speed. Supabase sync is handled by SyncWorker.
 logger.info(f"Using SQLite database at {DB_PATH}")
-db = SqliteDatabase(str(DB_PATH), pragmas={
-    'journal_mode': 'wal',
-    'busy_timeout': 30000,  # Wait up to 30s for locks (SyncWorker may hold writes)
-})
+db = SqliteDatabase(str(DB_PATH), pragmas=DB_PRAGMAS)
 
 
 class BaseModel(Model):
@@ -344,7 +345,9 @@ class RoomExit(BaseModel):
         details_dict["last_success_at"] = datetime.now(timezone.utc).isoformat()
         details_dict["source"] = source
 
-        self.details = json.dumps(details_dict)
+        # Compact separators keep the row small; the column must stay JSON text
+        # because SyncWorker copies it verbatim to the remote TEXT column.
+        self.details = json.dumps(details_dict, separators=(",", ":"))
         logger.info(f"Saving details for exit {self.id}: {self.details}")
         self.save()
 
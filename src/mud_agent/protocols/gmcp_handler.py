@@ -24,7 +24,7 @@ class GMCPHandler:
         enabled: Whether GMCP is enabled
         data: Dictionary of GMCP data, organized by module
         callbacks: List of callback functions for all GMCP messages
-        module_callbacks: Dictionary of callback functions for specific modules
+        module_callbacks: Dictionary of callback tuples for specific modules
         supported_modules: Set of GMCP modules supported by the server
     """
 
@@ -43,7 +43,9 @@ class GMCPHandler:
         self.enabled = True
         self.data: dict[str, Any] = {}
         self.callbacks: list[Callable[[str, Any], None]] = []
-        self.module_callbacks: dict[str, list[Callable[[str, Any], None]]] = {}
+        # Tuples are rebuilt on (un)registration, which is rare, so dispatch
+        # never has to copy or guard against mutation mid-iteration.
+        self.module_callbacks: dict[str, tuple[Callable[[str, Any], None], ...]] = {}
         self.supported_modules: set[str] = set()
         logger.debug("GMCP handler initialized")
 
@@ -68,11 +70,9 @@ class GMCPHandler:
             callback: Function to call when a message for this module is received.
                      The function should accept module (str) and data (Any) parameters.
         """
-        if module not in self.module_callbacks:
-            self.module_callbacks[module] = []
-
-        if callback not in self.module_callbacks[module]:
-            self.module_callbacks[module].append(callback)
+        callbacks = self.module_callbacks.get(module, ())
+        if callback not in callbacks:
+            self.module_callbacks[module] = (*callbacks, callback)
             logger.debug(
                 f"Registered GMCP callback for module {module}: {callback.__name__}"
             )
@@ -100,7 +100,9 @@ class GMCPHandler:
             module in self.module_callbacks
             and callback in self.module_callbacks[module]
         ):
-            self.module_callbacks[module].remove(callback)
+            self.module_callbacks[module] = tuple(
+                cb for cb in self.module_callbacks[module] if cb != callback
+            )
             logger.debug(
                 f"Unregistered GMCP callback for module {module}: {callback.__name__}"
             )
@@ -154,7 +156,8 @@ class GMCPHandler:
                 data = json.loads(message[space_idx + 1 :])
 
             # Validate module against allowed prefixes
-            top_level = module.split(".")[0].lower()
+            module_parts = module.split(".")
+            top_level = module_parts[0].lower()
             if top_level not in self.ALLOWED_MODULE_PREFIXES:
                 logger.warning(
                     f"Rejected GMCP module with unknown prefix '{top_level}': {module}"
@@ -169,7 +172,6 @@ class GMCPHandler:
             old_data = self.get_module_data(module)
 
             # Store in module data
-            module_parts = module.split(".")
             current_dict = self.data
             for part in module_parts[:-1]:
                 if part not in current_dict:
@@ -202,39 +204,28 @@ class GMCPHandler:
     def _call_callbacks(self, module: str, data: Any) -> None:
         """Call registered callbacks for a GMCP message.
 
+        General callbacks run first, then those registered for the module
+        itself, then those for its parent module (e.g. 'char' for 'char.vitals').
+
         Args:
             module: The GMCP module name
             data: The GMCP data
         """
-        # Call general callbacks
-        for callback in self.callbacks:
-            try:
-                callback(module, data)
-            except Exception as e:
-                logger.error(
-                    f"Error in GMCP callback {callback.__name__}: {e}", exc_info=True
-                )
-
-        # Call module-specific callbacks
-        if module in self.module_callbacks:
-            for callback in self.module_callbacks[module]:
-                try:
-                    callback(module, data)
-                except Exception as e:
-                    logger.error(
-                        f"Error in GMCP module callback {callback.__name__} for {module}: {e}",
-                        exc_info=True,
-                    )
-
-        # Call parent module callbacks (e.g. 'char' for 'char.vitals')
-        parent_module = ".".join(module.split(".")[:-1])
-        if parent_module and parent_module in self.module_callbacks:
-            for callback in self.module_callbacks[parent_module]:
+        parent_module = module.rpartition(".")[0]
+        dispatch = [
+            ("all modules", self.callbacks),
+            (module, self.module_callbacks.get(module, ())),
+        ]
+        if parent_module:
+            dispatch.append((parent_module, self.module_callbacks.get(parent_module, ())))
+
+        for target, callbacks in dispatch:
+            for callback in callbacks:
                 try:
                     callback(module, data)
                 except Exception as e:
                     logger.error(
-                        f"Error in GMCP parent module callback {callback.__name__} for {parent_module}: {e}",
+                        f"Error in GMCP callback {callback.__name__} for {target}: {e}",
                         exc_info=True,
                     )
 
@@ -6,10 +6,27 @@ This module contains functions for initializing the MUD agent and game state.
 
 import asyncio
 import logging
+import re
 import time
 
 logger = logging.getLogger(__name__)
 
+# Text that shows the welcome banner (or the login that follows it) has arrived
+_BANNER_PATTERNS = (
+    "Welcome to Aardwolf",
+    "Type 'help' for help",
+    "Type 'news' for news",
+    "Type 'who' to see who's online",
+    "By what name do you wish to be known",  # Login prompt
+    "Password:",  # Password prompt
+    "Last login",  # Login success message
+    "You were last logged in",  # Another login success message
+    "Welcome back",  # Another login success message
+)
+# One case-insensitive alternation, compiled once, instead of lowercasing the
+# response and scanning it once per pattern on every poll
+_BANNER_RE = re.compile("|".join(map(re.escape, _BANNER_PATTERNS)), re.IGNORECASE)
+
 
 async def detect_welcome_banner(agent, timeout=5):
     """Detect when the welcome banner has completed.
@@ -22,25 +39,11 @@ async def detect_welcome_banner(agent, timeout=5):
         bool: True if welcome banner detected, False if timeout
     """
     start_time = time.time()
-    banner_patterns = [
-        "Welcome to Aardwolf",
-        "Type 'help' for help",
-        "Type 'news' for news",
-        "Type 'who' to see who's online",
-        "By what name do you wish to be known",  # Login prompt
-        "Password:",  # Password prompt
-        "Last login",  # Login success message
-        "You were last logged in",  # Another login success message
-        "Welcome back",  # Another login success message
-    ]
 
     try:
         # Check if we've already received the welcome banner in the last response
         if hasattr(agent, "last_response") and agent.last_response:
-            if any(
-                pattern.lower() in agent.last_response.lower()
-                for pattern in banner_patterns
-            ):
+            if _BANNER_RE.search(agent.last_response):
                 logger.debug("Welcome banner already detected in last response")
                 return True
 
@@ -59,10 +62,7 @@ async def detect_welcome_banner(agent, timeout=5):
         while time.time() - start_time < timeout:
             # Check if any of the banner patterns are in the last response
             if hasattr(agent, "last_response") and agent.last_response:
-                if any(
-                    pattern.lower() in agent.last_response.lower()
-                    for pattern in banner_patterns
-                ):
+                if _BANNER_RE.search(agent.last_response):
                     elapsed = time.time() - start_time
                     logger.debug(f"Welcome banner detected after {elapsed:.2f} seconds")
                     return True
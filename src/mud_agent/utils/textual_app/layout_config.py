@@ -17,7 +17,7 @@ class LayoutMode(Enum):
     COMPACT = "compact" # Minimal layout for small screens
 
 
-@dataclass
+@dataclass(slots=True)
 class LayoutDimensions:
     """Layout dimension configuration."""
     status_height: int = 10
@@ -28,7 +28,7 @@ class LayoutDimensions:
     container_padding: int = 1
 
 
-@dataclass
+@dataclass(slots=True)
 class LayoutConfig:
     """Complete layout configuration."""
     mode: LayoutMode = LayoutMode.CLASSIC
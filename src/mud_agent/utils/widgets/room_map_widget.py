@@ -1,3 +1,4 @@
+import functools
 from typing import Any, ClassVar
 
 from rich.text import Text
@@ -7,6 +8,27 @@ from textual.widgets import Static
 from .state_listener import StateListener
 
 
+@functools.lru_cache(maxsize=256)
+def _build_grid(room_chars: tuple[str, str, str], strokes: tuple[tuple[int, int, str], ...]) -> str:
+    """Build the 5x3 grid text for a room.
+
+    The grid depends only on the room characters and which exits are drawn, so
+    map containers re-rendering many rooms share a handful of cached results.
+
+    Args:
+        room_chars (tuple[str, str, str]): The left bracket, center and right bracket characters.
+        strokes (tuple[tuple[int, int, str], ...]): (row, column, character) for each drawn exit.
+
+    Returns:
+        str: The three grid rows joined by newlines.
+    """
+    grid = [[" "] * 5 for _ in range(3)]
+    grid[1][1:4] = room_chars
+    for r, c, char in strokes:
+        grid[r][c] = char
+    return "\n".join("".join(row) for row in grid)
+
+
 class RoomMapWidget(StateListener, Static):
     """A widget to display a 5x3 ASCII art representation of a single MUD room.
 
@@ -87,8 +109,6 @@ class RoomMapWidget(StateListener, Static):
         if not has_room and not self.is_current:
             return Text("  .  ", justify="center")
 
-        grid = [[' ' for _ in range(5)] for _ in range(3)]
-
         center_char = self.ROOM_CHARS["CURRENT"] if self.is_current else self.ROOM_CHARS["OTHER"]
 
         # Check for shop
@@ -102,16 +122,13 @@ class RoomMapWidget(StateListener, Static):
             # The user asked: "change the # symbol on the room in the mapper container to a $ symbol if the room has a shop"
             # This implies when it's NOT the current room (which is @).
 
-        grid[1][1] = self.ROOM_CHARS["LEFT"]
-        grid[1][2] = center_char
-        grid[1][3] = self.ROOM_CHARS["RIGHT"]
-
+        room_chars = (self.ROOM_CHARS["LEFT"], center_char, self.ROOM_CHARS["RIGHT"])
         exits = self.room_data.get("exits", {})
-        for exit_dir, (r, c, char) in self.DRAW_MAP.items():
-            if exit_dir.lower() in exits:
-                grid[r][c] = char
+        strokes = tuple(
+            stroke for exit_dir, stroke in self.DRAW_MAP.items() if exit_dir.lower() in exits
+        )
 
-        return Text("\n".join("".join(row) for row in grid), justify="center")
+        return Text(_build_grid(room_chars, strokes), justify="center")
 
     def update_content(self) -> None:
         """Refresh the widget to reflect the latest room data."""
@@ -5,6 +5,7 @@ This module provides a base widget that listens for state events and updates acc
 """
 
 import logging
+from collections.abc import Iterable
 from typing import Any
 
 logger = logging.getLogger(__name__)
@@ -20,24 +21,44 @@ class StateListener:
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.subscribed_keys = set()
+        # Private so every change goes through the subscribe methods, which
+        # also invalidate the cached _keys_view
+        self._subscribed_keys: set[str] = set()
+        # Tuple snapshot of the subscribed keys; rebuilt lazily after a change
+        self._keys_view: tuple[str, ...] | None = None
         self.state_manager = None
 
+    @property
+    def subscribed_keys(self) -> frozenset[str]:
+        """Read-only snapshot of the subscribed keys.
+
+        Use the subscribe/unsubscribe methods to change subscriptions.
+        """
+        return frozenset(self._subscribed_keys)
+
     def subscribe_to_state(self, state_key: str) -> None:
         """Subscribes to a state key."""
-        self.subscribed_keys.add(state_key)
+        self._subscribed_keys.add(state_key)
+        self._keys_view = None
+
+    def subscribe_to_states(self, state_keys: Iterable[str]) -> None:
+        """Subscribes to several state keys at once."""
+        self._subscribed_keys.update(state_keys)
+        self._keys_view = None
 
     def unsubscribe_from_state(self, state_key: str) -> None:
         """Unsubscribes from a state key."""
-        self.subscribed_keys.discard(state_key)
+        self._subscribed_keys.discard(state_key)
+        self._keys_view = None
 
     def clear_subscriptions(self) -> None:
         """Clears all state subscriptions."""
-        self.subscribed_keys.clear()
+        self._subscribed_keys.clear()
+        self._keys_view = None
 
     def on_state_update(self, state_key: str, data: Any) -> None:
         """Handle state updates synchronously with async compatibility."""
-        if state_key in self.subscribed_keys:
+        if state_key in self._subscribed_keys:
             update = getattr(self, "update_display", None)
             if update:
                 try:
@@ -58,7 +79,7 @@ class StateListener:
 
     async def on_state_update_async(self, state_key: str, data: Any) -> None:
         """Async variant for tests and async listeners."""
-        if state_key in self.subscribed_keys:
+        if state_key in self._subscribed_keys:
             await self.update_display(data)
 
     def get_state_data(self, state_key: str) -> Any:
@@ -106,11 +127,13 @@ class StateListener:
 
     def is_subscribed_to(self, state_key: str) -> bool:
         """Checks if the widget is subscribed to a state key."""
-        return state_key in self.subscribed_keys
+        return state_key in self._subscribed_keys
 
-    def get_subscribed_keys(self) -> list[str]:
-        """Gets the list of subscribed keys."""
-        return list(self.subscribed_keys)
+    def get_subscribed_keys(self) -> tuple[str, ...]:
+        """Gets the subscribed keys as a tuple, cached until the subscriptions change."""
+        if self._keys_view is None:
+            self._keys_view = tuple(self._subscribed_keys)
+        return self._keys_view
 
 
 
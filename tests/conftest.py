@@ -5,7 +5,15 @@ Pytest configuration file.
 import os
 import sys
 
+import pytest
+
 # Add the src directory to the Python path
 sys.path.insert(
     0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src"))
 )
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_xdist_auto_num_workers(config):
+    """Leave two cores free for the OS and the controller under `-n auto`."""
+    return max((os.cpu_count() or 1) - 2, 1)
@@ -1,3 +1,4 @@
+import json
 import tempfile
 from pathlib import Path
 
@@ -179,6 +180,20 @@ def test_record_exit_success_updates_latest_commands(test_db):
     assert second_details["last_success_at"] != first_details["last_success_at"]
 
 
+def test_record_exit_success_stores_compact_json(test_db):
+    room_entity1 = Entity.create(name="Room A", entity_type="Room")
+    room_entity2 = Entity.create(name="Room B", entity_type="Room")
+    room_a = Room.create(entity=room_entity1, room_number=3051)
+    room_b = Room.create(entity=room_entity2, room_number=3052)
+
+    exit_obj = RoomExit.create(from_room=room_a, direction="north", to_room_number=3052, to_room=room_b)
+    exit_obj.record_exit_success(move_command="north", pre_commands=["open north"])
+
+    stored = RoomExit.get_by_id(exit_obj.id).details
+    assert ", " not in stored and '": ' not in stored
+    assert json.loads(stored)["pre_commands"] == ["open north"]
+
+
 def test_record_exit_success_cardinal_synonyms(test_db):
     room_entity1 = Entity.create(name="Room A", entity_type="Room")
     room_entity2 = Entity.create(name="Room B", entity_type="Room")
@@ -1,28 +1,68 @@
 
+import os
 import tempfile
 from pathlib import Path
 
 import pytest
-from mud_agent.db.models import Room, RoomExit, Entity, find_path_between_rooms, ALL_MODELS
+from peewee import sort_models
+from mud_agent.db.models import Room, RoomExit, Entity, find_path_between_rooms, ALL_MODELS, DB_PRAGMAS
 from mud_agent.db.models import db as peewee_db
 from mud_agent.mcp.game_knowledge_graph import GameKnowledgeGraph
 
+# The temp database is thrown away after each test, so durability buys nothing:
+# keep the journal and temp tables in memory and skip fsync on every commit.
+FAST_TEST_PRAGMAS = {
+    "journal_mode": "memory",
+    "synchronous": "off",
+    "temp_store": "memory",
+    "cache_size": -65536,  # 64 MB
+}
+
+def _build_schema_scripts():
+    models = sort_models(ALL_MODELS)
+    create = []
+    for model in models:
+        create.append(model._schema._create_table().query()[0])
+        create.extend(ctx.query()[0] for ctx in model._schema._create_indexes())
+    drop = [f'DROP TABLE IF EXISTS "{model._meta.table_name}"' for model in reversed(models)]
+    return ";\n".join(create) + ";", ";\n".join(drop) + ";"
+
+
+# The schema DDL has no bound parameters, so it is generated once at import and
+# the fixture creates/drops every table with a single executescript() call.
+_CREATE_SCHEMA_SQL, _DROP_SCHEMA_SQL = _build_schema_scripts()
+
+
+def mk_entity(name, entity_type="Room"):
+    """Insert an Entity row and return its id.
+
+    A bare INSERT skips the model-instance round trip of Entity.create(), while
+    peewee still fills in the field defaults and column order from the model.
+    """
+    return Entity.insert(name=name, entity_type=entity_type).execute()
+
 
 @pytest.fixture
 def test_database():
     # Use a temp file so that asyncio.to_thread can access the same DB
-    tmp = tempfile.NamedTemporaryFile(suffix='.db', delete=False)
+    # Prefix with the xdist worker id so parallel workers never share a file
+    worker = os.environ.get("PYTEST_XDIST_WORKER", "gw0")
+    tmp = tempfile.NamedTemporaryFile(prefix=f"pf_{worker}_", suffix='.db', delete=False)
     test_db_path = tmp.name
     tmp.close()
 
-    peewee_db.init(test_db_path)
+    # Pass the pragmas through init() rather than executing them once, so the
+    # worker-thread connections opened by asyncio.to_thread get them too.
+    peewee_db.init(test_db_path, pragmas=FAST_TEST_PRAGMAS)
     peewee_db.connect()
-    peewee_db.create_tables(ALL_MODELS)
+    peewee_db.connection().executescript(_CREATE_SCHEMA_SQL)
 
     yield peewee_db
 
-    peewee_db.drop_tables(ALL_MODELS)
+    peewee_db.connection().executescript(_DROP_SCHEMA_SQL)
     peewee_db.close()
+    # Hand the shared db back with the application's own pragmas
+    peewee_db.init(test_db_path, pragmas=DB_PRAGMAS)
     Path(test_db_path).unlink(missing_ok=True)
 
 @pytest.fixture
@@ -35,11 +75,11 @@ def test_pathfinding_uses_move_command(test_database):
     """Test that pathfinding uses the recorded move_command."""
 
     # Create Room 1
-    r1_entity = Entity.create(name="1", entity_type="Room")
+    r1_entity = mk_entity("1")
     r1 = Room.create(entity=r1_entity, room_number=1, zone="Test")
 
     # Create Room 2
-    r2_entity = Entity.create(name="2", entity_type="Room")
+    r2_entity = mk_entity("2")
     r2 = Room.create(entity=r2_entity, room_number=2, zone="Test")
 
     # Create Exit from 1 to 2 with direction "portal"
@@ -67,11 +107,11 @@ async def test_record_exit_success_matches_portal(knowledge_graph, test_database
     """Test that record_exit_success matches 'enter portal' to exit 'portal'."""
 
     # Create Room 1
-    r1_entity = Entity.create(name="1", entity_type="Room")
+    r1_entity = mk_entity("1")
     r1 = Room.create(entity=r1_entity, room_number=1, zone="Test")
 
     # Create Room 2
-    r2_entity = Entity.create(name="2", entity_type="Room")
+    r2_entity = mk_entity("2")
     r2 = Room.create(entity=r2_entity, room_number=2, zone="Test")
 
     # Create Exit from 1 to 2 with direction "portal" (simulating what the mapper might see)
@@ -106,15 +146,15 @@ async def test_find_path_with_zone_filter(knowledge_graph, test_database):
     """Zone filter constrains room lookup by name to rooms in the specified zone."""
 
     # Create Room 100 in ZoneA
-    r1_entity = Entity.create(name="100", entity_type="Room")
+    r1_entity = mk_entity("100")
     r1 = Room.create(entity=r1_entity, room_number=100, zone="ZoneA", full_name="Market Square")
 
     # Create Room 200 in ZoneB with the SAME room name
-    r2_entity = Entity.create(name="200", entity_type="Room")
+    r2_entity = mk_entity("200")
     r2 = Room.create(entity=r2_entity, room_number=200, zone="ZoneB", full_name="Market Square")
 
     # Create Room 101 in ZoneA connected to Room 100
-    r3_entity = Entity.create(name="101", entity_type="Room")
+    r3_entity = mk_entity("101")
     r3 = Room.create(entity=r3_entity, room_number=101, zone="ZoneA")
     RoomExit.create(from_room=r3, to_room=r1, to_room_number=100, direction="n")
 
@@ -137,10 +177,10 @@ async def test_find_path_with_zone_filter(knowledge_graph, test_database):
 async def test_find_path_without_zone_filter(knowledge_graph, test_database):
     """Without zone filter, room lookup by name finds any matching room."""
 
-    r1_entity = Entity.create(name="300", entity_type="Room")
+    r1_entity = mk_entity("300")
     r1 = Room.create(entity=r1_entity, room_number=300, zone="SomeZone", full_name="Tavern")
 
-    r2_entity = Entity.create(name="301", entity_type="Room")
+    r2_entity = mk_entity("301")
     r2 = Room.create(entity=r2_entity, room_number=301, zone="SomeZone")
     RoomExit.create(from_room=r2, to_room=r1, to_room_number=300, direction="e")
 
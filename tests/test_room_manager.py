@@ -2,163 +2,193 @@
 Tests for the RoomManager class.
 """
 
-from unittest.mock import AsyncMock, MagicMock
+import asyncio
+import gc
+import socket
+from types import MappingProxyType, SimpleNamespace
+from unittest.mock import ANY, AsyncMock, MagicMock, call
 
 import pytest
 
 from mud_agent.agent.room_manager import RoomManager
 
+# Every test here is async and none leaves tasks running, so share one event
+# loop across the module instead of building a fresh loop per test.
+pytestmark = pytest.mark.asyncio(loop_scope="module")
 
-@pytest.fixture
-def mock_agent():
-    """Create a mock agent with mock event bus and knowledge graph."""
-    agent = MagicMock()
-    agent.events = AsyncMock()
-    agent.knowledge_graph = AsyncMock()
-    agent.state_manager = MagicMock()
-    agent.state_manager.room_num = None
-    return agent
+# Shared read-only room payloads; RoomManager only reads room data, so tests
+# can hand it the same mapping instead of building a new dict every time.
+_STARTING_ROOM = MappingProxyType({"num": 1, "name": "Starting Room"})
+_NEW_ROOM = MappingProxyType({"num": 2, "name": "New Room"})
 
 
+async def perform_move(manager, *commands, room):
+    """Send each command in order, then deliver the resulting room update."""
+    for command in commands:
+        await manager._handle_command_sent(command=command)
+    await manager._on_room_update(room_data=room)
 
-@pytest.fixture
-def manager(mock_agent):
-    """Create a RoomManager instance with a mock agent."""
-    return RoomManager(mock_agent)
 
+class RecordingAsyncStub:
+    """Cheap stand-in for AsyncMock on the hot record_exit_success path.
 
-@pytest.mark.asyncio
-async def test_successful_move_records_exit(manager, mock_agent):
-    """Test that a successful move correctly records an exit."""
-    # Set initial room
-    manager.current_room = {"num": 1, "name": "Starting Room"}
+    Calls are recorded as mock.call objects, so tests keep using call_args,
+    call_count and the assert_called* helpers without AsyncMock's per-call
+    bookkeeping. Set side_effect to an exception to make the next awaits raise.
+    """
 
-    # Simulate sending a movement command
-    await manager._handle_command_sent(command="north")
+    def __init__(self):
+        self.call_args_list = []
+        self.side_effect = None
 
-    # Simulate the room update event
-    await manager._on_room_update(room_data={"num": 2, "name": "New Room"})
+    async def __call__(self, *args, **kwargs):
+        self.call_args_list.append(call(*args, **kwargs))
+        if self.side_effect is not None:
+            raise self.side_effect
 
-    # Check that record_exit_success was called with the correct arguments
-    mock_agent.knowledge_graph.record_exit_success.assert_called_once_with(
-        from_room_num=1,
-        to_room_num=2,
-        direction="north",
-        move_cmd="north",
-        pre_cmds=[],
-    )
+    @property
+    def call_count(self):
+        return len(self.call_args_list)
 
-@pytest.mark.asyncio
-async def test_move_with_valid_pre_command(manager, mock_agent):
-    """Test that a move with a valid pre-command is recorded correctly."""
-    manager.current_room = {"num": 1, "name": "Starting Room"}
+    @property
+    def call_args(self):
+        return self.call_args_list[-1] if self.call_args_list else None
 
-    # Simulate pre-command and move command
-    await manager._handle_command_sent(command="open north")
-    await manager._handle_command_sent(command="north")
+    def assert_not_called(self):
+        assert not self.call_args_list, f"Expected no calls, got {self.call_args_list}"
 
-    # Simulate room update
-    await manager._on_room_update(room_data={"num": 2, "name": "New Room"})
+    def assert_called_once(self):
+        assert self.call_count == 1, f"Expected 1 call, got {self.call_args_list}"
 
-    mock_agent.knowledge_graph.record_exit_success.assert_called_once_with(
-        from_room_num=1,
-        to_room_num=2,
-        direction="north",
-        move_cmd="north",
-        pre_cmds=["open north"],
-    )
+    def assert_called_once_with(self, *args, **kwargs):
+        self.assert_called_once()
+        assert self.call_args == call(*args, **kwargs), (
+            f"Expected {call(*args, **kwargs)}, got {self.call_args}"
+        )
 
-@pytest.mark.asyncio
-async def test_move_with_invalid_pre_command(manager, mock_agent):
-    """Test that an invalid pre-command is not included in the exit record."""
-    manager.current_room = {"num": 1, "name": "Starting Room"}
+    def reset_mock(self):
+        self.call_args_list.clear()
+        self.side_effect = None
 
-    # Simulate invalid pre-command and move command
-    await manager._handle_command_sent(command="open south")
-    await manager._handle_command_sent(command="north")
 
-    # Simulate room update
-    await manager._on_room_update(room_data={"num": 2, "name": "New Room"})
+@pytest.fixture(autouse=True)
+def _pause_gc():
+    """Keep collector pauses out of the async paths under test."""
+    gc.disable()
+    yield
+    gc.enable()
 
-    mock_agent.knowledge_graph.record_exit_success.assert_called_once_with(
-        from_room_num=1,
-        to_room_num=2,
-        direction="north",
-        move_cmd="north",
-        pre_cmds=[],
-    )
 
-@pytest.mark.asyncio
-async def test_directionless_move_with_pre_commands(manager, mock_agent):
-    """Test that pre-commands are considered valid for directionless moves."""
-    manager.current_room = {"num": 1, "name": "Starting Room"}
+@pytest.fixture(autouse=True)
+def _no_network(monkeypatch):
+    """Fail fast if anything under test tries to open a network connection."""
 
-    # Simulate pre-command and directionless move
-    await manager._handle_command_sent(command="unlock portal")
-    await manager._handle_command_sent(command="enter portal")
+    def guard(*args, **kwargs):
+        raise RuntimeError("network access is blocked in room manager tests")
 
-    # Simulate room update
-    await manager._on_room_update(room_data={"num": 2, "name": "New Room"})
+    monkeypatch.setattr(socket.socket, "connect", guard)
 
-    mock_agent.knowledge_graph.record_exit_success.assert_called_once_with(
-        from_room_num=1,
-        to_room_num=2,
-        direction="enter portal",
-        move_cmd="enter portal",
-        pre_cmds=["unlock portal"],
-    )
 
+@pytest.fixture(scope="module")
+def _mock_agent_template():
+    """Build the mock agent tree once per module; mock_agent resets it per test.
 
+    Each mock is limited to the attributes RoomManager actually uses, so a
+    mistyped attribute in a test raises instead of silently creating a child.
+    """
+    agent = MagicMock(spec_set=["events", "knowledge_graph", "state_manager"])
+    agent.events = MagicMock(spec_set=["emit", "on"])
+    agent.events.emit = AsyncMock()
+    agent.knowledge_graph = MagicMock(spec_set=["record_exit_success", "add_entity"])
+    agent.knowledge_graph.add_entity = AsyncMock()
+    agent.knowledge_graph.record_exit_success = RecordingAsyncStub()
+    agent.state_manager = MagicMock(spec_set=["room_num"])
+    return agent
 
-@pytest.mark.asyncio
-async def test_move_with_multiple_valid_pre_commands(manager, mock_agent):
-    """Test that a move with multiple valid pre-commands is recorded correctly."""
-    manager.current_room = {"num": 1, "name": "Starting Room"}
 
-    await manager._handle_command_sent(command="unlock north")
-    await manager._handle_command_sent(command="open north")
-    await manager._handle_command_sent(command="north")
+@pytest.fixture
+def mock_agent(_mock_agent_template):
+    """Create a mock agent with mock event bus and knowledge graph."""
+    agent = _mock_agent_template
+    # Clears calls, return values and side effects on every child mock; plain
+    # attributes are not reset, so re-seed the ones tests overwrite.
+    agent.reset_mock(return_value=True, side_effect=True)
+    agent.knowledge_graph.record_exit_success.reset_mock()
+    agent.state_manager.room_num = None
+    return agent
 
-    await manager._on_room_update(room_data={"num": 2, "name": "New Room"})
 
-    # Verify call and ignore order of pre-commands
-    mock_agent.knowledge_graph.record_exit_success.assert_called_once()
-    _, kwargs = mock_agent.knowledge_graph.record_exit_success.call_args
-    assert kwargs["from_room_num"] == 1
-    assert kwargs["to_room_num"] == 2
-    assert kwargs["direction"] == "north"
-    assert kwargs["move_cmd"] == "north"
-    assert set(kwargs["pre_cmds"]) == {"unlock north", "open north"}
-
-@pytest.mark.asyncio
-async def test_move_with_mixed_pre_commands(manager, mock_agent):
-    """Test that only valid pre-commands are recorded."""
-    manager.current_room = {"num": 1, "name": "Starting Room"}
+@pytest.fixture
+def manager(mock_agent):
+    """Create a RoomManager instance with a mock agent."""
+    return RoomManager(mock_agent)
 
-    await manager._handle_command_sent(command="unlock north")
-    await manager._handle_command_sent(command="open south")
-    await manager._handle_command_sent(command="north")
 
-    await manager._on_room_update(room_data={"num": 2, "name": "New Room"})
+@pytest.fixture
+def force_exit_gate(manager, monkeypatch):
+    """Replace the force-exit delay with a gate the test opens explicitly.
 
-    mock_agent.knowledge_graph.record_exit_success.assert_called_once_with(
+    `waiting` is set once the check has captured its starting room and is
+    parked on the delay; setting `release` lets the check continue.
+    """
+    gate = SimpleNamespace(waiting=asyncio.Event(), release=asyncio.Event())
+
+    async def wait_for_release():
+        gate.waiting.set()
+        await gate.release.wait()
+
+    monkeypatch.setattr(manager, "_wait_for_room_change", wait_for_release)
+    return gate
+
+
+@pytest.mark.parametrize(
+    "commands, move_cmd, pre_cmds",
+    [
+        pytest.param(["north"], "north", [], id="plain-move"),
+        pytest.param(["open north", "north"], "north", ["open north"], id="valid-pre-command"),
+        pytest.param(["open south", "north"], "north", [], id="invalid-pre-command"),
+        pytest.param(
+            ["unlock north", "open north", "north"],
+            "north",
+            ["unlock north", "open north"],
+            id="multiple-valid-pre-commands",
+        ),
+        pytest.param(
+            ["unlock north", "open south", "north"],
+            "north",
+            ["unlock north"],
+            id="mixed-pre-commands",
+        ),
+        pytest.param(["open north", "north;look"], "north", ["open north"], id="semicolon-chain"),
+    ],
+)
+async def test_move_records_exit_with_matching_pre_commands(
+    manager, mock_agent, commands, move_cmd, pre_cmds
+):
+    """A successful move records the exit with only the pre-commands for its direction."""
+    manager.current_room = _STARTING_ROOM
+
+    await perform_move(manager, *commands, room=_NEW_ROOM)
+
+    record_exit_success = mock_agent.knowledge_graph.record_exit_success
+    record_exit_success.assert_called_once()
+    assert record_exit_success.call_args == call(
         from_room_num=1,
         to_room_num=2,
-        direction="north",
-        move_cmd="north",
-        pre_cmds=["unlock north"],
+        direction=move_cmd,
+        move_cmd=move_cmd,
+        pre_cmds=ANY,
     )
+    # Pre-commands are tracked in a set, so their recorded order is not defined
+    assert sorted(record_exit_success.call_args.kwargs["pre_cmds"]) == sorted(pre_cmds)
 
-@pytest.mark.asyncio
-async def test_directionless_move_with_multiple_pre_commands(manager, mock_agent):
-    """Test that multiple pre-commands are valid for directionless moves."""
-    manager.current_room = {"num": 1, "name": "Starting Room"}
 
-    await manager._handle_command_sent(command="unlock portal")
-    await manager._handle_command_sent(command="recite spell")
-    await manager._handle_command_sent(command="enter portal")
+async def test_directionless_move_with_pre_commands(manager, mock_agent):
+    """Test that pre-commands are considered valid for directionless moves."""
+    manager.current_room = _STARTING_ROOM
 
-    await manager._on_room_update(room_data={"num": 2, "name": "New Room"})
+    # Simulate pre-command and directionless move, then the room update
+    await perform_move(manager, "unlock portal", "enter portal", room=_NEW_ROOM)
 
     mock_agent.knowledge_graph.record_exit_success.assert_called_once_with(
         from_room_num=1,
@@ -168,46 +198,40 @@ async def test_directionless_move_with_multiple_pre_commands(manager, mock_agent
         pre_cmds=["unlock portal"],
     )
 
-@pytest.mark.asyncio
-async def test_move_with_no_room_change(manager, mock_agent):
-    """Test that an exit is not recorded if the room does not change."""
-    manager.current_room = {"num": 1, "name": "Starting Room"}
-
-    await manager._handle_command_sent(command="north")
-
-    await manager._on_room_update(room_data={"num": 1, "name": "Starting Room"})
 
-    mock_agent.knowledge_graph.record_exit_success.assert_not_called()
-
-@pytest.mark.asyncio
-async def test_move_with_semicolon_chain_records_exit(manager, mock_agent):
-    """Test that semicolon-chained commands record movement and pre-commands."""
-    manager.current_room = {"num": 1, "name": "Starting Room"}
 
-    await manager._handle_command_sent(command="open north")
-    await manager._handle_command_sent(command="north;look")
+async def test_directionless_move_with_multiple_pre_commands(manager, mock_agent):
+    """Test that multiple pre-commands are valid for directionless moves."""
+    manager.current_room = _STARTING_ROOM
 
-    await manager._on_room_update(room_data={"num": 2, "name": "New Room"})
+    await perform_move(manager, "unlock portal", "recite spell", "enter portal", room=_NEW_ROOM)
 
     mock_agent.knowledge_graph.record_exit_success.assert_called_once_with(
         from_room_num=1,
         to_room_num=2,
-        direction="north",
-        move_cmd="north",
-        pre_cmds=["open north"],
+        direction="enter portal",
+        move_cmd="enter portal",
+        pre_cmds=["unlock portal"],
     )
 
-@pytest.mark.asyncio
+async def test_move_with_no_room_change(manager, mock_agent):
+    """Test that an exit is not recorded if the room does not change."""
+    manager.current_room = _STARTING_ROOM
+
+    await perform_move(manager, "north", room=_STARTING_ROOM)
+
+    mock_agent.knowledge_graph.record_exit_success.assert_not_called()
+
 async def test_directionless_move_with_semicolon_chain(manager, mock_agent):
     """Test that portal enter in a chained command is captured."""
-    manager.current_room = {"num": 1, "name": "Starting Room"}
+    manager.current_room = _STARTING_ROOM
 
     await manager._handle_command_sent(command="unlock portal; enter portal", from_room_num=1)
 
     assert manager.pending_exit_command == "enter portal"
     assert "unlock portal" in manager.pending_pre_commands
 
-    await manager._on_room_update(room_data={"num": 2, "name": "New Room"})
+    await manager._on_room_update(room_data=_NEW_ROOM)
 
     mock_agent.knowledge_graph.record_exit_success.assert_called_once_with(
         from_room_num=1,
@@ -217,15 +241,11 @@ async def test_directionless_move_with_semicolon_chain(manager, mock_agent):
         pre_cmds=["unlock portal"],
     )
 
-@pytest.mark.asyncio
 async def test_climb_directionless_move_with_pre_commands(manager, mock_agent):
     """Test that 'climb' moves are captured with pre-commands."""
-    manager.current_room = {"num": 1, "name": "Starting Room"}
+    manager.current_room = _STARTING_ROOM
 
-    await manager._handle_command_sent(command="unlock rope")
-    await manager._handle_command_sent(command="climb rope")
-
-    await manager._on_room_update(room_data={"num": 2, "name": "New Room"})
+    await perform_move(manager, "unlock rope", "climb rope", room=_NEW_ROOM)
 
     mock_agent.knowledge_graph.record_exit_success.assert_called_once_with(
         from_room_num=1,
@@ -235,25 +255,28 @@ async def test_climb_directionless_move_with_pre_commands(manager, mock_agent):
         pre_cmds=["unlock rope"],
     )
 
-@pytest.mark.asyncio
 async def test_say_triggers_force_exit_check(manager, mock_agent):
     """Test that 'say' token triggers a force exit check emission."""
-    import asyncio
-    manager.current_room = {"num": 1, "name": "Starting Room"}
+    manager.current_room = _STARTING_ROOM
+    force_check_emitted = asyncio.Event()
+
+    async def record_emit(event, **kwargs):
+        if event == "force_exit_check":
+            force_check_emitted.set()
+
+    mock_agent.events.emit.side_effect = record_emit
 
     await manager._handle_command_sent(command="say hello; enter portal")
-    await asyncio.sleep(0)
+    # The emit runs in a background task; wait for it rather than guessing loop turns
+    await asyncio.wait_for(force_check_emitted.wait(), timeout=1)
 
-    mock_agent.events.emit.assert_any_call("force_exit_check", command="say hello")
+    mock_agent.events.emit.assert_any_await("force_exit_check", command="say hello")
 
-@pytest.mark.asyncio
 async def test_first_movement_in_chain_is_recorded(manager, mock_agent):
     """Test that only the first movement in a chain is captured."""
-    manager.current_room = {"num": 1, "name": "Starting Room"}
-
-    await manager._handle_command_sent(command="open north; north; east")
+    manager.current_room = _STARTING_ROOM
 
-    await manager._on_room_update(room_data={"num": 2, "name": "New Room"})
+    await perform_move(manager, "open north; north; east", room=_NEW_ROOM)
 
     mock_agent.knowledge_graph.record_exit_success.assert_called_once_with(
         from_room_num=1,
@@ -263,15 +286,11 @@ async def test_first_movement_in_chain_is_recorded(manager, mock_agent):
         pre_cmds=["open north"],
     )
 
-@pytest.mark.asyncio
 async def test_board_directionless_move_with_pre_commands(manager, mock_agent):
     """Test that 'board' moves are captured with pre-commands."""
-    manager.current_room = {"num": 1, "name": "Starting Room"}
+    manager.current_room = _STARTING_ROOM
 
-    await manager._handle_command_sent(command="unlock ship")
-    await manager._handle_command_sent(command="board ship")
-
-    await manager._on_room_update(room_data={"num": 2, "name": "New Room"})
+    await perform_move(manager, "unlock ship", "board ship", room=_NEW_ROOM)
 
     mock_agent.knowledge_graph.record_exit_success.assert_called_once_with(
         from_room_num=1,
@@ -281,14 +300,11 @@ async def test_board_directionless_move_with_pre_commands(manager, mock_agent):
         pre_cmds=["unlock ship"],
     )
 
-@pytest.mark.asyncio
 async def test_escape_directionless_move_without_pre_commands(manager, mock_agent):
     """Test that 'escape' moves are captured without pre-commands."""
-    manager.current_room = {"num": 1, "name": "Starting Room"}
-
-    await manager._handle_command_sent(command="escape")
+    manager.current_room = _STARTING_ROOM
 
-    await manager._on_room_update(room_data={"num": 2, "name": "New Room"})
+    await perform_move(manager, "escape", room=_NEW_ROOM)
 
     mock_agent.knowledge_graph.record_exit_success.assert_called_once_with(
         from_room_num=1,
@@ -303,7 +319,6 @@ async def test_escape_directionless_move_without_pre_commands(manager, mock_agen
 # Edge Case Tests for record_exit_success
 # ============================================================================
 
-@pytest.mark.asyncio
 async def test_say_command_triggers_room_change(manager, mock_agent):
     """Test that a 'say' command that causes a room change records the exit.
 
@@ -335,17 +350,16 @@ async def test_say_command_triggers_room_change(manager, mock_agent):
     )
 
 
-@pytest.mark.asyncio
-async def test_say_command_no_room_change(manager, mock_agent):
+async def test_say_command_no_room_change(manager, mock_agent, force_exit_gate):
     """Test that a 'say' command without room change doesn't record exit."""
     manager.current_room = {"num": 10, "name": "Magic Room"}
+    force_exit_gate.release.set()
 
     await manager._handle_force_exit_check("say hello")
 
     mock_agent.knowledge_graph.record_exit_success.assert_not_called()
 
 
-@pytest.mark.asyncio
 async def test_force_exit_check_no_initial_room(manager, mock_agent):
     """Test force exit check when current_room is None."""
     manager.current_room = None
@@ -355,73 +369,63 @@ async def test_force_exit_check_no_initial_room(manager, mock_agent):
     mock_agent.knowledge_graph.record_exit_success.assert_not_called()
 
 
-@pytest.mark.asyncio
-async def test_force_exit_check_room_becomes_none(manager, mock_agent):
+async def test_force_exit_check_room_becomes_none(manager, mock_agent, force_exit_gate):
     """Test force exit check when room becomes None after command."""
-    import asyncio
-    manager.current_room = {"num": 10, "name": "Room"}
+    manager.current_room = _STARTING_ROOM
 
     task = asyncio.create_task(manager._handle_force_exit_check("say test"))
-    await asyncio.sleep(0.1)
+    await force_exit_gate.waiting.wait()
     manager.current_room = None
+    force_exit_gate.release.set()
     await task
 
     mock_agent.knowledge_graph.record_exit_success.assert_not_called()
 
 
-@pytest.mark.asyncio
 async def test_room_update_with_incomplete_data(manager, mock_agent):
     """Test room update with missing 'num' field."""
-    manager.current_room = {"num": 1, "name": "Room"}
-    await manager._handle_command_sent(command="north")
-
+    manager.current_room = _STARTING_ROOM
     # Room update with incomplete data should not crash
-    await manager._on_room_update(room_data={"name": "Incomplete Room"})
+    await perform_move(manager, "north", room={"name": "Incomplete Room"})
 
     mock_agent.knowledge_graph.record_exit_success.assert_not_called()
 
 
-@pytest.mark.asyncio
 async def test_room_update_with_none_data(manager, mock_agent):
     """Test room update with None as room data."""
-    manager.current_room = {"num": 1, "name": "Room"}
-    await manager._handle_command_sent(command="north")
-
+    manager.current_room = _STARTING_ROOM
     # Room update with None should not crash
-    await manager._on_room_update(room_data=None)
+    await perform_move(manager, "north", room=None)
 
     mock_agent.knowledge_graph.record_exit_success.assert_not_called()
 
 
-@pytest.mark.asyncio
 async def test_room_update_without_pending_exit(manager, mock_agent):
     """Test room update when no movement command was sent."""
-    manager.current_room = {"num": 1, "name": "Room"}
+    manager.current_room = _STARTING_ROOM
 
     # Room update without pending exit command
-    await manager._on_room_update(room_data={"num": 2, "name": "New Room"})
+    await manager._on_room_update(room_data=_NEW_ROOM)
 
     # Should not record exit since no movement command was sent
     mock_agent.knowledge_graph.record_exit_success.assert_not_called()
 
 
-@pytest.mark.asyncio
 async def test_room_update_with_none_from_room(manager, mock_agent):
     """Test room update when from_room_num_on_exit is None."""
-    manager.current_room = {"num": 1, "name": "Room"}
+    manager.current_room = _STARTING_ROOM
     manager.pending_exit_command = "north"
     manager.from_room_num_on_exit = None
 
-    await manager._on_room_update(room_data={"num": 2, "name": "New Room"})
+    await manager._on_room_update(room_data=_NEW_ROOM)
 
     # Should not record exit when from_room_num is None
     mock_agent.knowledge_graph.record_exit_success.assert_not_called()
 
 
-@pytest.mark.asyncio
 async def test_pre_commands_cleared_after_successful_move(manager, mock_agent):
     """Test that pre-commands are cleared after a successful move."""
-    manager.current_room = {"num": 1, "name": "Room"}
+    manager.current_room = _STARTING_ROOM
 
     await manager._handle_command_sent(command="unlock north")
     await manager._handle_command_sent(command="open north")
@@ -430,7 +434,7 @@ async def test_pre_commands_cleared_after_successful_move(manager, mock_agent):
     # Verify pre-commands were set
     assert len(manager.pending_pre_commands) > 0
 
-    await manager._on_room_update(room_data={"num": 2, "name": "New Room"})
+    await manager._on_room_update(room_data=_NEW_ROOM)
 
     # Pre-commands should be cleared after successful move
     assert len(manager.pending_pre_commands) == 0
@@ -438,10 +442,9 @@ async def test_pre_commands_cleared_after_successful_move(manager, mock_agent):
     assert manager.from_room_num_on_exit is None
 
 
-@pytest.mark.asyncio
 async def test_pre_commands_persist_on_failed_move(manager, mock_agent):
     """Test that pre-commands persist when move fails (room doesn't change)."""
-    manager.current_room = {"num": 1, "name": "Room"}
+    manager.current_room = _STARTING_ROOM
 
     await manager._handle_command_sent(command="unlock north")
     await manager._handle_command_sent(command="north")
@@ -449,53 +452,43 @@ async def test_pre_commands_persist_on_failed_move(manager, mock_agent):
     initial_pre_cmds = manager.pending_pre_commands.copy()
 
     # Room doesn't change - failed move
-    await manager._on_room_update(room_data={"num": 1, "name": "Room"})
+    await manager._on_room_update(room_data=_STARTING_ROOM)
 
     # Pre-commands should still be present (not cleared on failed move)
     assert manager.pending_pre_commands == initial_pre_cmds
 
 
-@pytest.mark.asyncio
 async def test_multiple_pre_commands_same_direction(manager, mock_agent):
     """Test multiple pre-commands for the same direction."""
-    manager.current_room = {"num": 1, "name": "Room"}
+    manager.current_room = _STARTING_ROOM
 
-    await manager._handle_command_sent(command="unlock north")
-    await manager._handle_command_sent(command="open north")
-    await manager._handle_command_sent(command="kick north")
-    await manager._handle_command_sent(command="north")
-
-    await manager._on_room_update(room_data={"num": 2, "name": "New Room"})
+    await perform_move(manager, "unlock north", "open north", "kick north", "north", room=_NEW_ROOM)
 
     call_args = mock_agent.knowledge_graph.record_exit_success.call_args
     assert set(call_args.kwargs["pre_cmds"]) == {"unlock north", "open north", "kick north"}
 
 
-@pytest.mark.asyncio
 async def test_exception_in_record_exit_success_handled(manager, mock_agent):
     """Test that exceptions in record_exit_success are handled gracefully."""
-    manager.current_room = {"num": 1, "name": "Room"}
+    manager.current_room = _STARTING_ROOM
 
     # Make record_exit_success raise an exception
     mock_agent.knowledge_graph.record_exit_success.side_effect = Exception("Database error")
 
-    await manager._handle_command_sent(command="north")
-
     # Should not crash even if record_exit_success fails
-    await manager._on_room_update(room_data={"num": 2, "name": "New Room"})
+    await perform_move(manager, "north", room=_NEW_ROOM)
 
     # Verify the method was called despite the exception
     mock_agent.knowledge_graph.record_exit_success.assert_called_once()
 
 
-@pytest.mark.asyncio
 async def test_non_movement_command_does_not_clear_pending_exit(manager, mock_agent):
     """Non-movement commands like 'look' should NOT clear pending exit state.
 
     This is important for lag tolerance: a 'look' typed after 'north' shouldn't
     prevent the room transition from being recorded when the GMCP update arrives.
     """
-    manager.current_room = {"num": 1, "name": "Room"}
+    manager.current_room = _STARTING_ROOM
 
     await manager._handle_command_sent(command="north", from_room_num=1)
     assert manager.pending_exit_command == "north"
@@ -505,7 +498,7 @@ async def test_non_movement_command_does_not_clear_pending_exit(manager, mock_ag
     assert manager.pending_exit_command == "north"
 
     # Room update should still record the exit from the 'north' command
-    await manager._on_room_update(room_data={"num": 2, "name": "New Room"})
+    await manager._on_room_update(room_data=_NEW_ROOM)
 
     mock_agent.knowledge_graph.record_exit_success.assert_called_once_with(
         from_room_num=1,
@@ -516,48 +509,45 @@ async def test_non_movement_command_does_not_clear_pending_exit(manager, mock_ag
     )
 
 
-@pytest.mark.asyncio
-async def test_all_cardinal_directions(manager, mock_agent):
+@pytest.mark.parametrize(
+    "direction",
+    ["n", "s", "e", "w", "u", "d", "north", "south", "east", "west", "up", "down"],
+)
+async def test_all_cardinal_directions(manager, mock_agent, direction):
     """Test that all cardinal directions are properly detected."""
-    directions = ["n", "s", "e", "w", "u", "d", "north", "south", "east", "west", "up", "down"]
-
-    for direction in directions:
-        manager.current_room = {"num": 1, "name": "Room"}
-        mock_agent.knowledge_graph.record_exit_success.reset_mock()
+    manager.current_room = _STARTING_ROOM
 
-        await manager._handle_command_sent(command=direction)
-        await manager._on_room_update(room_data={"num": 2, "name": "New Room"})
+    await manager._handle_command_sent(command=direction)
+    await manager._on_room_update(room_data=_NEW_ROOM)
 
-        mock_agent.knowledge_graph.record_exit_success.assert_called_once()
-        call_args = mock_agent.knowledge_graph.record_exit_success.call_args
-        assert call_args.kwargs["direction"] == direction
-        assert call_args.kwargs["move_cmd"] == direction
+    mock_agent.knowledge_graph.record_exit_success.assert_called_once()
+    call_args = mock_agent.knowledge_graph.record_exit_success.call_args
+    assert call_args.kwargs["direction"] == direction
+    assert call_args.kwargs["move_cmd"] == direction
 
 
-@pytest.mark.asyncio
-async def test_all_directionless_commands(manager, mock_agent):
-    """Test that all directionless movement commands are detected."""
-    commands = [
+@pytest.mark.parametrize(
+    "command, expected",
+    [
         ("enter portal", "enter portal"),
         ("board ship", "board ship"),
         ("escape", "escape"),
         ("climb ladder", "climb ladder"),
-    ]
-
-    for command, expected in commands:
-        manager.current_room = {"num": 1, "name": "Room"}
-        mock_agent.knowledge_graph.record_exit_success.reset_mock()
+    ],
+)
+async def test_all_directionless_commands(manager, mock_agent, command, expected):
+    """Test that all directionless movement commands are detected."""
+    manager.current_room = _STARTING_ROOM
 
-        await manager._handle_command_sent(command=command)
-        await manager._on_room_update(room_data={"num": 2, "name": "New Room"})
+    await manager._handle_command_sent(command=command)
+    await manager._on_room_update(room_data=_NEW_ROOM)
 
-        mock_agent.knowledge_graph.record_exit_success.assert_called_once()
-        call_args = mock_agent.knowledge_graph.record_exit_success.call_args
-        assert call_args.kwargs["direction"] == expected
-        assert call_args.kwargs["move_cmd"] == expected
+    mock_agent.knowledge_graph.record_exit_success.assert_called_once()
+    call_args = mock_agent.knowledge_graph.record_exit_success.call_args
+    assert call_args.kwargs["direction"] == expected
+    assert call_args.kwargs["move_cmd"] == expected
 
 
-@pytest.mark.asyncio
 async def test_room_update_updates_knowledge_graph(manager, mock_agent):
     """Test that room updates are added to knowledge graph."""
     room_data = {"num": 1, "name": "Test Room", "terrain": "inside", "exits": {"n": 2}}
@@ -571,7 +561,6 @@ async def test_room_update_updates_knowledge_graph(manager, mock_agent):
     assert call_args["num"] == 1
 
 
-@pytest.mark.asyncio
 async def test_exception_in_knowledge_graph_add_entity(manager, mock_agent):
     """Test that exceptions in add_entity are handled gracefully."""
     mock_agent.knowledge_graph.add_entity.side_effect = Exception("Database error")
@@ -585,25 +574,20 @@ async def test_exception_in_knowledge_graph_add_entity(manager, mock_agent):
     mock_agent.knowledge_graph.add_entity.assert_called_once()
 
 
-@pytest.mark.asyncio
 async def test_rapid_room_changes(manager, mock_agent):
     """Test rapid sequence of room changes."""
     manager.current_room = {"num": 1, "name": "Room 1"}
 
-    await manager._handle_command_sent(command="north")
-    await manager._on_room_update(room_data={"num": 2, "name": "Room 2"})
+    await perform_move(manager, "north", room={"num": 2, "name": "Room 2"})
 
-    await manager._handle_command_sent(command="east")
-    await manager._on_room_update(room_data={"num": 3, "name": "Room 3"})
+    await perform_move(manager, "east", room={"num": 3, "name": "Room 3"})
 
-    await manager._handle_command_sent(command="south")
-    await manager._on_room_update(room_data={"num": 4, "name": "Room 4"})
+    await perform_move(manager, "south", room={"num": 4, "name": "Room 4"})
 
     # Should have recorded 3 exits
     assert mock_agent.knowledge_graph.record_exit_success.call_count == 3
 
 
-@pytest.mark.asyncio
 async def test_speedwalk_suppresses_exit_recording(manager, mock_agent):
     """Speedwalk commands should NOT record exits."""
     manager.current_room = {"num": 1, "name": "Start Room"}
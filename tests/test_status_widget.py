@@ -4,12 +4,46 @@ Tests for the status widget and its components.
 """
 
 import pytest
+import pytest_asyncio
 from textual.app import App
 from textual.containers import Container
 from textual.widgets import Header
 
 from mud_agent.utils.widgets.containers import StatusContainer
 
+# Keep the Textual app tests on a single worker under `pytest -n auto --dist loadgroup`,
+# and run them on the module event loop so they can share one running app.
+pytestmark = [
+    pytest.mark.xdist_group("textual"),
+    pytest.mark.asyncio(loop_scope="module"),
+]
+
+# Character header fields that tests may overwrite; restored after each test
+HEADER_FIELDS = ("character_name", "level", "race", "character_class")
+
+
+class MockStateManager:
+    """Minimal state manager carrying the fields the status widgets read."""
+
+    def __init__(self):
+        self.character_name = "TestCharacter"
+        self.level = 50
+        self.race = "Human"
+        self.character_class = "Warrior"
+        self.health = {"current": 100, "max": 100}
+        self.mana = {"current": 100, "max": 100}
+        self.movement = {"current": 100, "max": 100}
+        self.hp_current = 100
+        self.hp_max = 100
+        self.mp_current = 100
+        self.mp_max = 100
+        self.mv_current = 100
+        self.mv_max = 100
+        self.hunger = {"current": 10, "max": 100}
+        self.thirst = {"current": 10, "max": 100}
+        self.status_effects = []
+        self.in_combat = False
+
 
 class TestStatusApp(App):
     """Test app for status widget components."""
@@ -88,111 +122,86 @@ class TestStatusApp(App):
             yield StatusContainer(id="status-widget")
 
 
-@pytest.mark.asyncio
-async def test_status_container_composition():
-    """Test that the StatusContainer composes correctly with all expected child widgets."""
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def status_pilot():
+    """Run a single TestStatusApp for the whole module and yield (app, pilot)."""
     app = TestStatusApp()
+    # Nothing here inspects animations, so skip them and just wait one tick
+    app.animation_level = "none"
     async with app.run_test() as pilot:
-        # Wait for the app to be ready
-        await pilot.wait_for_scheduled_animations()
+        await pilot.pause()
+        yield app, pilot
+
 
-        # Get the status widget
-        status_widget = app.query_one("#status-widget")
+@pytest.fixture
+def status_widget(status_pilot):
+    """Return the shared StatusContainer, restoring its header after the test."""
+    app, _ = status_pilot
+    widget = app.query_one("#status-widget")
+    header = widget.character_header
+    saved = {field: getattr(header, field) for field in HEADER_FIELDS} if header else {}
+    yield widget
+    for field, value in saved.items():
+        setattr(header, field, value)
 
-        # Check that it's a StatusContainer
-        assert isinstance(status_widget, StatusContainer)
 
-        # Check that it has all the expected child containers
-        assert hasattr(status_widget, "character_header")
-        assert hasattr(status_widget, "vitals_container")
-        assert hasattr(status_widget, "needs_container")
-        assert hasattr(status_widget, "worth_container")
-        assert hasattr(status_widget, "stats_container")
-        assert hasattr(status_widget, "status_effects")
+async def test_status_container_composition(status_widget):
+    """Test that the StatusContainer composes correctly with all expected child widgets."""
+    # Check that it's a StatusContainer
+    assert isinstance(status_widget, StatusContainer)
+
+    # Check that it has all the expected child containers
+    assert hasattr(status_widget, "character_header")
+    assert hasattr(status_widget, "vitals_container")
+    assert hasattr(status_widget, "needs_container")
+    assert hasattr(status_widget, "worth_container")
+    assert hasattr(status_widget, "stats_container")
+    assert hasattr(status_widget, "status_effects")
 
 
-@pytest.mark.asyncio
-async def test_status_container_update():
+async def test_status_container_update(status_widget):
     """Test that the StatusContainer can be updated with mock data."""
-    app = TestStatusApp()
-    async with app.run_test() as pilot:
-        # Wait for the app to be ready
-        await pilot.wait_for_scheduled_animations()
-
-        # Get the status widget
-        status_widget = app.query_one("#status-widget")
-
-        # Create a mock state manager
-        class MockStateManager:
-            def __init__(self):
-                self.character_name = "TestCharacter"
-                self.level = 50
-                self.race = "Human"
-                self.character_class = "Warrior"
-                self.health = {"current": 100, "max": 100}
-                self.mana = {"current": 100, "max": 100}
-                self.movement = {"current": 100, "max": 100}
-                self.hp_current = 100
-                self.hp_max = 100
-                self.mp_current = 100
-                self.mp_max = 100
-                self.mv_current = 100
-                self.mv_max = 100
-                self.hunger = {"current": 10, "max": 100}
-                self.thirst = {"current": 10, "max": 100}
-                self.status_effects = []
-                self.in_combat = False
-
-        # Update the status widget with mock data
-        mock_state_manager = MockStateManager()
-
-        # Skip the test if character_header is not available
-        if (
-            not hasattr(status_widget, "character_header")
-            or status_widget.character_header is None
-        ):
-            pytest.skip("character_header not available")
-
-        # Update the character header
-        status_widget.character_header.character_name = (
-            mock_state_manager.character_name
-        )
-        status_widget.character_header.level = mock_state_manager.level
-        status_widget.character_header.race = mock_state_manager.race
-        status_widget.character_header.character_class = (
-            mock_state_manager.character_class
-        )
-
-        # Call update_content if it exists
-        if hasattr(status_widget.character_header, "update_content"):
-            status_widget.character_header.update_content()
-
-        # Check that the character header was updated
-        assert status_widget.character_header.character_name == "TestCharacter"
-        assert status_widget.character_header.level == 50
-        assert status_widget.character_header.race == "Human"
-        assert status_widget.character_header.character_class == "Warrior"
-
-
-@pytest.mark.asyncio
-async def test_vitals_container():
+    # Update the status widget with mock data
+    mock_state_manager = MockStateManager()
+
+    # Skip the test if character_header is not available
+    if (
+        not hasattr(status_widget, "character_header")
+        or status_widget.character_header is None
+    ):
+        pytest.skip("character_header not available")
+
+    # Update the character header
+    status_widget.character_header.character_name = (
+        mock_state_manager.character_name
+    )
+    status_widget.character_header.level = mock_state_manager.level
+    status_widget.character_header.race = mock_state_manager.race
+    status_widget.character_header.character_class = (
+        mock_state_manager.character_class
+    )
+
+    # Call update_content if it exists
+    if hasattr(status_widget.character_header, "update_content"):
+        status_widget.character_header.update_content()
+
+    # Check that the character header was updated
+    assert status_widget.character_header.character_name == "TestCharacter"
+    assert status_widget.character_header.level == 50
+    assert status_widget.character_header.race == "Human"
+    assert status_widget.character_header.character_class == "Warrior"
+
+
+async def test_vitals_container(status_widget):
     """Test that the VitalsContainer has the expected widgets."""
-    app = TestStatusApp()
-    async with app.run_test() as pilot:
-        # Wait for the app to be ready
-        await pilot.wait_for_scheduled_animations()
-
-        # Get the status widget
-        status_widget = app.query_one("#status-widget")
-
-        # Skip the test if vitals_container is not available
-        if (
-            not hasattr(status_widget, "vitals_container")
-            or status_widget.vitals_container is None
-        ):
-            pytest.skip("vitals_container not available")
-
-        # Check that the vitals container has the expected widgets
-        assert hasattr(status_widget.vitals_container, "hp_widget")
-        assert hasattr(status_widget.vitals_container, "mp_widget")
-        assert hasattr(status_widget.vitals_container, "mv_widget")
+    # Skip the test if vitals_container is not available
+    if (
+        not hasattr(status_widget, "vitals_container")
+        or status_widget.vitals_container is None
+    ):
+        pytest.skip("vitals_container not available")
+
+    # Check that the vitals container has the expected widgets
+    assert hasattr(status_widget.vitals_container, "hp_widget")
+    assert hasattr(status_widget.vitals_container, "mp_widget")
+    assert hasattr(status_widget.vitals_container, "mv_widget")
@@ -11,11 +11,11 @@ from mud_agent.utils.widgets.containers import (
 )
 
 
+@pytest.mark.skip(
+    reason="Widget attributes may not be initialized until after mounting in a Textual app context."
+)
 def test_status_container_widgets_visibility():
     """Test that all widgets in the status container are present (not necessarily visible)."""
-    pytest.skip(
-        "Widget attributes may not be initialized until after mounting in a Textual app context."
-    )
     # Create a status container
     # status_container = StatusContainer(id="status-widget")
     # Only check for attribute existence if running in a Textual app context
@@ -47,32 +47,38 @@ def test_status_container_widgets_visibility():
     assert hasattr(stats_container, "dr_widget")
 
 
-def test_vitals_widgets_visibility():
-    """Test that all vitals widgets are present (not necessarily visible)."""
-    # Create a vitals container
-    vitals_container = VitalsContainer(id="vitals-container")
+@pytest.fixture(scope="module")
+def vitals_container():
+    """Build one unmounted vitals container for all attribute checks."""
+    return VitalsContainer(id="vitals-container")
 
-    # Check that the vitals container has all the expected widgets
-    assert hasattr(vitals_container, "hp_widget")
-    assert hasattr(vitals_container, "mp_widget")
-    assert hasattr(vitals_container, "mv_widget")
 
-    # Do not check for widget attributes like current_value or update_display, as they may be set on mount
+@pytest.fixture(scope="module")
+def stats_container():
+    """Build one unmounted stats container for all attribute checks."""
+    return StatsContainer(id="stats-container")
 
 
-def test_stats_widgets_visibility():
-    """Test that all stats widgets are present (not necessarily visible)."""
-    # Create a stats container
-    stats_container = StatsContainer(id="stats-container")
+# Only check the widgets exist; values like current_value are set on mount
+@pytest.mark.parametrize("attr", ["hp_widget", "mp_widget", "mv_widget"])
+def test_vitals_widgets_visibility(vitals_container, attr):
+    """Test that each vitals widget is present (not necessarily visible)."""
+    assert hasattr(vitals_container, attr)
 
-    # Check that the stats container has all the expected widgets
-    assert hasattr(stats_container, "str_widget")
-    assert hasattr(stats_container, "int_widget")
-    assert hasattr(stats_container, "wis_widget")
-    assert hasattr(stats_container, "dex_widget")
-    assert hasattr(stats_container, "con_widget")
-    assert hasattr(stats_container, "luck_widget")
-    assert hasattr(stats_container, "hr_widget")
-    assert hasattr(stats_container, "dr_widget")
 
-    # Do not check for widget attributes like current_value or update_display, as they may be set on mount
+@pytest.mark.parametrize(
+    "attr",
+    [
+        "str_widget",
+        "int_widget",
+        "wis_widget",
+        "dex_widget",
+        "con_widget",
+        "luck_widget",
+        "hr_widget",
+        "dr_widget",
+    ],
+)
+def test_stats_widgets_visibility(stats_container, attr):
+    """Test that each stats widget is present (not necessarily visible)."""
+    assert hasattr(stats_container, attr)
@@ -0,0 +1,16 @@
+"""
+Shared fixtures for the textual_app tests.
+"""
+
+import asyncio
+from unittest.mock import Mock
+
+import pytest
+
+
+@pytest.fixture
+def mock_create_task(monkeypatch):
+    """Replace asyncio.create_task with a mock that closes the coroutine it gets."""
+    mock = Mock(side_effect=lambda coro: coro.close())
+    monkeypatch.setattr(asyncio, "create_task", mock)
+    return mock
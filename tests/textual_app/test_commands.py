@@ -5,23 +5,38 @@ from unittest.mock import AsyncMock, Mock, patch
 import pytest
 
 from mud_agent.utils.textual_app.commands import CommandProcessor
+from mud_agent.utils.textual_app.core import MUDTextualApp
 from mud_agent.utils.widgets.command_log import CommandLog
 
 
+# Command log handed out by every mock_app.query_one() call
+_COMMAND_LOG = Mock(spec=CommandLog)
+
+
 class TestCommandProcessor:
     """Test cases for CommandProcessor class."""
 
-    @pytest.fixture
-    def mock_app(self):
-        """Create a mock app for testing."""
-        app = Mock()
+    @pytest.fixture(scope="module")
+    def _mock_app_template(self):
+        """Build the mock app once per module; mock_app resets it per test."""
+        app = Mock(spec=MUDTextualApp)
         app.agent = Mock()
         app.agent.client = Mock()
-        app.agent.client.connected = True
         app.agent.client.send = AsyncMock()
         app.agent.send_command = AsyncMock(return_value="")
         app.state_manager = Mock()
-        app.query_one = Mock(return_value=Mock(spec=CommandLog))
+        app.query_one = Mock(return_value=_COMMAND_LOG)
+        return app
+
+    @pytest.fixture
+    def mock_app(self, _mock_app_template):
+        """Create a mock app for testing."""
+        app = _mock_app_template
+        # Clears calls and side effects but keeps configured return values;
+        # plain attributes are not reset, so re-seed the ones tests overwrite.
+        # The reset also reaches _COMMAND_LOG through query_one's return value.
+        app.reset_mock(side_effect=True)
+        app.agent.client.connected = True
         return app
 
     @pytest.fixture
@@ -35,16 +50,15 @@ class TestCommandProcessor:
         assert command_processor.agent == mock_app.agent
         assert command_processor.state_manager == mock_app.state_manager
 
-    @pytest.mark.asyncio
-    async def test_submit_command_basic(self, command_processor):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_submit_command_basic(self, command_processor, mock_create_task):
         """Test basic command submission."""
         command = "look"
-        with patch('asyncio.create_task') as mock_create_task:
-            await command_processor.submit_command(command)
-            # Current implementation creates a single task for processing
-            assert mock_create_task.call_count == 1
+        await command_processor.submit_command(command)
+        # Current implementation creates a single task for processing
+        assert mock_create_task.call_count == 1
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_submit_command_internal(self, command_processor):
         """Test internal command submission."""
         command = "/help"
@@ -52,17 +66,17 @@ class TestCommandProcessor:
             await command_processor.submit_command(command)
             mock_handle.assert_called_once_with(command)
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_submit_command_not_connected(self, command_processor):
         """Test submitting a command when not connected to the server."""
         command_processor.agent.client.connected = False
         command = "look"
         await command_processor.submit_command(command)
-        command_processor.app.query_one.return_value.write.assert_any_call("[bold red]Not connected to server[/bold red]")
+        _COMMAND_LOG.write.assert_any_call("[bold red]Not connected to server[/bold red]")
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_handle_internal_command_unknown(self, command_processor):
         """Test handling an unknown internal command."""
         command = "/unknown"
         await command_processor.handle_internal_command(command)
-        command_processor.app.query_one.return_value.write.assert_any_call(f"[bold yellow]Unknown internal command: {command}[/bold yellow]")
+        _COMMAND_LOG.write.assert_any_call(f"[bold yellow]Unknown internal command: {command}[/bold yellow]")
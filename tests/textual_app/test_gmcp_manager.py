@@ -1,17 +1,19 @@
 """Tests for textual_app gmcp_manager module."""
 
 import asyncio
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, call, patch
 
 import pytest
+import pytest_asyncio
 
+from mud_agent.utils.textual_app.core import MUDTextualApp
 from mud_agent.utils.textual_app.gmcp_manager import GMCPManager
 
 
-@pytest.fixture
-def mock_app():
-    """Create a mock app with mock agent and state_manager."""
-    app = MagicMock()
+@pytest.fixture(scope="module")
+def _mock_app_template():
+    """Build the mock app once per module; mock_app resets it per test."""
+    app = MagicMock(spec=MUDTextualApp)
     app.agent = MagicMock()
     # Make sure the events object has an 'on' method that is a mock
     app.agent.client.events = MagicMock()
@@ -22,17 +24,21 @@ def mock_app():
 
 
 @pytest.fixture
-def gmcp_manager(mock_app, request):
+def mock_app(_mock_app_template):
+    """Create a mock app with mock agent and state_manager."""
+    _mock_app_template.reset_mock(side_effect=True)
+    return _mock_app_template
+
+
+@pytest_asyncio.fixture(loop_scope="module")
+async def gmcp_manager(mock_app):
     """Create a GMCPManager instance for testing."""
     manager = GMCPManager(mock_app)
+    yield manager
 
-    # Teardown logic to stop polling if it was started
-    async def finalizer():
-        if manager._gmcp_polling_task and not manager._gmcp_polling_task.done():
-            await manager.stop_gmcp_polling()
-
-    request.addfinalizer(lambda: asyncio.run(finalizer()))
-    return manager
+    # Stop polling on the tests' own loop if a test left it running
+    if manager._gmcp_polling_task and not manager._gmcp_polling_task.done():
+        await manager.stop_gmcp_polling()
 
 
 class TestGMCPManager:
@@ -46,16 +52,21 @@ class TestGMCPManager:
         assert gmcp_manager._gmcp_polling_task is None
         assert not gmcp_manager._gmcp_polling_enabled
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_setup(self, gmcp_manager):
         """Test the setup of the GMCPManager."""
         await gmcp_manager.setup()
 
         # Assert that the event subscriptions were made
-        gmcp_manager.agent.client.events.on.assert_any_call('gmcp_data', gmcp_manager._on_gmcp_data)
-        gmcp_manager.agent.client.events.on.assert_any_call('gmcp.room.info', gmcp_manager._on_room_info)
-        gmcp_manager.agent.client.events.on.assert_any_call('gmcp.char.vitals', gmcp_manager._on_char_vitals)
-        gmcp_manager.agent.client.events.on.assert_any_call('gmcp.char.stats', gmcp_manager._on_char_stats)
+        gmcp_manager.agent.client.events.on.assert_has_calls(
+            [
+                call('gmcp_data', gmcp_manager._on_gmcp_data),
+                call('gmcp.room.info', gmcp_manager._on_room_info),
+                call('gmcp.char.vitals', gmcp_manager._on_char_vitals),
+                call('gmcp.char.stats', gmcp_manager._on_char_stats),
+            ],
+            any_order=True,
+        )
 
     def test_on_gmcp_data(self, gmcp_manager):
         """Test the _on_gmcp_data method."""
@@ -63,7 +74,7 @@ class TestGMCPManager:
             gmcp_manager._on_gmcp_data('test.package', {'key': 'value'})
             mock_handle.assert_called_once_with('test.package', {'key': 'value'})
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     @patch("src.mud_agent.utils.textual_app.gmcp_manager.GMCPManager._gmcp_polling_worker")
     async def test_start_and_stop_gmcp_polling(self, mock_gmcp_polling_worker, gmcp_manager):
         stop_event = asyncio.Event()
@@ -1,9 +1,10 @@
 """Tests for layout configuration system."""
 
 import json
-import tempfile
+import logging
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from types import MappingProxyType
+from unittest.mock import patch
 
 import pytest
 
@@ -19,6 +20,17 @@ from mud_agent.utils.textual_app.layout_config import (
 )
 
 
+# CSS variables produced by the default layout configuration
+_EXPECTED_CSS_VARS = MappingProxyType({
+    '--status-height': '10',
+    '--command-input-height': '3',
+    '--map-width': '40%',
+    '--command-width': '60%',
+    '--widget-spacing': '1',
+    '--container-padding': '1',
+})
+
+
 class TestLayoutMode:
     """Test cases for LayoutMode enum."""
 
@@ -69,9 +81,14 @@ class TestLayoutDimensions:
 class TestLayoutConfig:
     """Test cases for LayoutConfig dataclass."""
 
-    def test_default_config(self):
+    @pytest.fixture(scope="module")
+    def default_config(self):
+        """Build one default LayoutConfig for the read-only checks."""
+        return LayoutConfig()
+
+    def test_default_config(self, default_config):
         """Test default configuration values."""
-        config = LayoutConfig()
+        config = default_config
         assert config.mode == LayoutMode.CLASSIC
         assert isinstance(config.dimensions, LayoutDimensions)
         assert config.enable_responsive is True
@@ -100,31 +117,41 @@ class TestLayoutConfig:
         assert config.show_footer is True
         assert config.theme == "dark"
 
-    def test_post_init_creates_dimensions(self):
+    def test_post_init_creates_dimensions(self, default_config):
         """Test that __post_init__ creates default dimensions if None."""
-        config = LayoutConfig(dimensions=None)
-        assert isinstance(config.dimensions, LayoutDimensions)
+        # dimensions defaults to None, so the default config went through __post_init__
+        assert isinstance(default_config.dimensions, LayoutDimensions)
 
 
 class TestLayoutManager:
     """Test cases for LayoutManager class."""
 
+    @pytest.fixture(scope="module")
+    def _shared_config_dir(self, tmp_path_factory):
+        """Create one config directory shared by the non-file tests."""
+        return tmp_path_factory.mktemp("layout_config")
+
     @pytest.fixture
-    def temp_config_dir(self):
-        """Create a temporary config directory."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            yield Path(temp_dir)
+    def temp_config_dir(self, tmp_path):
+        """Create a fresh config directory for tests that write their own file."""
+        return tmp_path
 
     @pytest.fixture
-    def layout_manager(self, temp_config_dir):
-        """Create a LayoutManager with temporary config directory."""
-        return LayoutManager(config_dir=temp_config_dir)
+    def layout_manager(self, _shared_config_dir):
+        """Create a LayoutManager on the shared directory, reset to defaults.
+
+        Setters save to disk, so the reset also overwrites whatever config
+        file an earlier test left behind.
+        """
+        manager = LayoutManager(config_dir=_shared_config_dir)
+        manager.reset_to_defaults()
+        return manager
 
-    def test_init_with_custom_config_dir(self, temp_config_dir):
+    def test_init_with_custom_config_dir(self, _shared_config_dir):
         """Test initialization with custom config directory."""
-        manager = LayoutManager(config_dir=temp_config_dir)
-        assert manager.config_dir == temp_config_dir
-        assert manager.config_file == temp_config_dir / "layout_config.json"
+        manager = LayoutManager(config_dir=_shared_config_dir)
+        assert manager.config_dir == _shared_config_dir
+        assert manager.config_file == _shared_config_dir / "layout_config.json"
 
     def test_init_with_default_config_dir(self):
         """Test initialization with default config directory."""
@@ -133,11 +160,18 @@ class TestLayoutManager:
             manager = LayoutManager()
             assert manager.config_dir == Path("/mock/home") / ".mud_agent"
 
-    def test_load_config_no_file(self, layout_manager):
+    def test_load_config_no_file(self, temp_config_dir):
         """Test loading config when no file exists."""
-        config = layout_manager.config
+        # The fresh directory keeps the shared fixture's saved file out of this test
+        assert not (temp_config_dir / "layout_config.json").exists()
+
+        manager = LayoutManager(config_dir=temp_config_dir)
+        config = manager.config
+
         assert isinstance(config, LayoutConfig)
         assert config.mode == LayoutMode.CLASSIC
+        # Loading the defaults must not write a file
+        assert not manager.config_file.exists()
 
     def test_load_config_with_file(self, temp_config_dir):
         """Test loading config from existing file."""
@@ -170,25 +204,24 @@ class TestLayoutManager:
         assert config.enable_responsive is False
         assert config.theme == "dark"
 
-    def test_load_config_invalid_json(self, temp_config_dir):
+    def test_load_config_invalid_json(self, temp_config_dir, caplog):
         """Test loading config with invalid JSON."""
         config_file = temp_config_dir / "layout_config.json"
 
         with open(config_file, 'w') as f:
             f.write("invalid json")
 
-        with patch('logging.getLogger') as mock_get_logger:
-            mock_logger = MagicMock()
-            mock_get_logger.return_value = mock_logger
+        with caplog.at_level(logging.WARNING):
             manager = LayoutManager(config_dir=temp_config_dir)
-            config = manager.config
+        config = manager.config
 
-            # Should fall back to default config
-            assert config.mode == LayoutMode.CLASSIC
-            mock_logger.warning.assert_called()
+        # Should fall back to default config
+        assert config.mode == LayoutMode.CLASSIC
+        assert any(record.levelname == "WARNING" for record in caplog.records)
 
-    def test_save_config(self, layout_manager, temp_config_dir):
+    def test_save_config(self, temp_config_dir):
         """Test saving configuration to file."""
+        layout_manager = LayoutManager(config_dir=temp_config_dir)
         layout_manager.save_config()
 
         config_file = temp_config_dir / "layout_config.json"
@@ -243,18 +276,7 @@ class TestLayoutManager:
 
     def test_get_css_variables(self, layout_manager):
         """Test getting CSS variables."""
-        css_vars = layout_manager.get_css_variables()
-
-        expected_vars = {
-            '--status-height': '10',
-            '--command-input-height': '3',
-            '--map-width': '40%',
-            '--command-width': '60%',
-            '--widget-spacing': '1',
-            '--container-padding': '1',
-        }
-
-        assert css_vars == expected_vars
+        assert layout_manager.get_css_variables() == _EXPECTED_CSS_VARS
 
     def test_is_classic_layout(self, layout_manager):
         """Test checking if using classic layout."""
@@ -287,36 +309,39 @@ class TestGlobalFunctions:
         manager2 = get_layout_manager()
         assert manager1 is manager2
 
-    def test_set_layout_mode_global(self):
-        """Test global set_layout_mode function."""
+    @pytest.fixture
+    def mock_get_layout_manager(self):
+        """Patch the global manager accessor the convenience functions call."""
         with patch('mud_agent.utils.textual_app.layout_config.get_layout_manager') as mock_get:
-            mock_manager = mock_get.return_value
+            yield mock_get
+
+    def test_set_layout_mode_global(self, mock_get_layout_manager):
+        """Test global set_layout_mode function."""
+        mock_manager = mock_get_layout_manager.return_value
 
-            set_layout_mode(LayoutMode.MODERN)
+        set_layout_mode(LayoutMode.MODERN)
 
-            mock_get.assert_called_once()
-            mock_manager.set_layout_mode.assert_called_once_with(LayoutMode.MODERN)
+        mock_get_layout_manager.assert_called_once()
+        mock_manager.set_layout_mode.assert_called_once_with(LayoutMode.MODERN)
 
-    def test_get_current_layout_global(self):
+    def test_get_current_layout_global(self, mock_get_layout_manager):
         """Test global get_current_layout function."""
-        with patch('mud_agent.utils.textual_app.layout_config.get_layout_manager') as mock_get:
-            mock_manager = mock_get.return_value
-            mock_config = LayoutConfig()
-            mock_manager.config = mock_config
+        mock_manager = mock_get_layout_manager.return_value
+        mock_config = LayoutConfig()
+        mock_manager.config = mock_config
 
-            result = get_current_layout()
+        result = get_current_layout()
 
-            assert result is mock_config
-            mock_get.assert_called_once()
+        assert result is mock_config
+        mock_get_layout_manager.assert_called_once()
 
-    def test_is_classic_layout_global(self):
+    def test_is_classic_layout_global(self, mock_get_layout_manager):
         """Test global is_classic_layout function."""
-        with patch('mud_agent.utils.textual_app.layout_config.get_layout_manager') as mock_get:
-            mock_manager = mock_get.return_value
-            mock_manager.is_classic_layout.return_value = True
+        mock_manager = mock_get_layout_manager.return_value
+        mock_manager.is_classic_layout.return_value = True
 
-            result = is_classic_layout()
+        result = is_classic_layout()
 
-            assert result is True
-            mock_get.assert_called_once()
-            mock_manager.is_classic_layout.assert_called_once()
+        assert result is True
+        mock_get_layout_manager.assert_called_once()
+        mock_manager.is_classic_layout.assert_called_once()
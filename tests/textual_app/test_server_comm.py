@@ -1,22 +1,27 @@
 """Tests for textual_app server_comm module."""
 
-from unittest.mock import ANY, AsyncMock, Mock, patch
+from unittest.mock import ANY, AsyncMock, Mock
 
 import pytest
 
+from mud_agent.utils.textual_app.core import MUDTextualApp
 from mud_agent.utils.textual_app.server_comm import ServerCommunicator
 
 
 @pytest.fixture
 def mock_app():
-    """Create a mock app with necessary components for testing."""
-    app = Mock()
+    """Create a mock app with necessary components for testing.
+
+    Function-scoped: tests replace return values and whole attributes such as
+    agent.aardwolf_gmcp, which a shared, reset template would carry over.
+    """
+    app = Mock(spec=MUDTextualApp)
     app.agent = Mock()
     app.agent.client = Mock()
-    app.agent.client.connected = False
     app.agent.client.send_command = AsyncMock()
     app.agent.client.connect = AsyncMock()
     app.agent.client.disconnect = AsyncMock()
+    app.agent.client.connected = False
     app.agent.logger = Mock()
     app.state_manager = Mock()
     app.query_one = Mock()
@@ -39,7 +44,7 @@ class TestServerCommunicator:
         assert server_communicator.state_manager == mock_app.state_manager
         assert hasattr(server_communicator, '_server_message_queue')
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_send_command_to_server_when_connected(self, server_communicator):
         """Test sending command when connected."""
         server_communicator.agent.client.connected = True
@@ -47,7 +52,7 @@ class TestServerCommunicator:
         await server_communicator.send_command_to_server(command)
         server_communicator.agent.client.send_command.assert_called_once_with(command, is_user_command=False)
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_send_command_to_server_when_disconnected(self, server_communicator):
         """Test sending command when disconnected."""
         server_communicator.agent.client.connected = False
@@ -56,7 +61,7 @@ class TestServerCommunicator:
         server_communicator.agent.client.send_command.assert_not_called()
         server_communicator.app.query_one.assert_called_with("#command-log", ANY)
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_connect_to_server_success(self, server_communicator):
         """Test successful connection to the server."""
         server_communicator.agent.client.connect.return_value = None
@@ -71,26 +76,25 @@ class TestServerCommunicator:
         server_communicator.agent.aardwolf_gmcp.initialize.assert_called_once()
         server_communicator.app.query_one.return_value.write.assert_called_with("[bold green]Connected to server[/bold green]")
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_connect_to_server_failure(self, server_communicator):
         """Test failed connection to the server."""
         server_communicator.agent.client.connect.side_effect = Exception("Connection failed")
         result = await server_communicator.connect_to_server()
         assert result is False
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_disconnect_from_server(self, server_communicator):
         """Test disconnecting from the server."""
         server_communicator.agent.client.connected = True
         await server_communicator.disconnect_from_server()
         server_communicator.agent.client.disconnect.assert_called_once()
 
-    @pytest.mark.asyncio
-    async def test_display_server_message(self, server_communicator):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_display_server_message(self, server_communicator, mock_create_task):
         """Test displaying a server message."""
-        with patch('asyncio.create_task') as mock_create_task:
-            message = "Hello, world!"
-            await server_communicator.display_server_message(message)
-            assert not server_communicator._server_message_queue.empty()
-            assert await server_communicator._server_message_queue.get() == message
-            mock_create_task.assert_called_once()
+        message = "Hello, world!"
+        await server_communicator.display_server_message(message)
+        assert not server_communicator._server_message_queue.empty()
+        assert await server_communicator._server_message_queue.get() == message
+        mock_create_task.assert_called_once()
@@ -1,7 +1,28 @@
 """Tests for textual_app styles module."""
 
+import re
+from collections import Counter
+
 from mud_agent.utils.textual_app.styles import STYLES as APP_CSS
 
+# Fragments the stylesheet must contain: screen layout, then the main UI sections
+_REQUIRED_FRAGMENTS = frozenset({
+    "Screen",
+    "layout:",
+    "vertical",
+    "Header",
+    "#status-container",
+    "#main-container",
+    "#map-container",
+    "#command-container",
+})
+# Contrast and readability properties; at least one must be styled
+_ACCESSIBILITY_FRAGMENTS = frozenset({"color", "background", "border"})
+# One alternation so a single scan of the stylesheet finds every fragment
+_FRAGMENT_RE = re.compile(
+    "|".join(map(re.escape, sorted(_REQUIRED_FRAGMENTS | _ACCESSIBILITY_FRAGMENTS)))
+)
+
 
 class TestStyles:
     """Test cases for styles module."""
@@ -12,48 +33,20 @@ class TestStyles:
         assert isinstance(APP_CSS, str)
         assert len(APP_CSS.strip()) > 0
 
-    def test_app_css_contains_screen_layout(self):
-        """Test that APP_CSS contains screen layout definitions."""
-        assert "Screen" in APP_CSS
-        assert "layout:" in APP_CSS
-        assert "vertical" in APP_CSS
+    def test_app_css_contains_expected_fragments(self):
+        """Test that APP_CSS defines the layout, main sections and accessibility styling."""
+        found = set(_FRAGMENT_RE.findall(APP_CSS))
 
-    def test_app_css_contains_main_sections(self):
-        """Test that APP_CSS contains main UI section definitions."""
-        assert "Header" in APP_CSS
-        assert "#status-container" in APP_CSS
-        assert "#main-container" in APP_CSS
-        assert "#map-container" in APP_CSS
-        assert "#command-container" in APP_CSS
+        missing = _REQUIRED_FRAGMENTS - found
+        assert not missing, f"APP_CSS is missing {sorted(missing)}"
+        assert found & _ACCESSIBILITY_FRAGMENTS, "CSS should include accessibility considerations"
 
     def test_css_syntax_validity(self):
         """Test basic CSS syntax validity."""
-        # Check for balanced braces
-        open_braces = APP_CSS.count('{')
-        close_braces = APP_CSS.count('}')
-        assert open_braces == close_braces, "Unbalanced braces in APP_CSS"
-
-        # Check for basic CSS structure
-        assert ':' in APP_CSS, "CSS should contain property declarations"
-        assert ';' in APP_CSS, "CSS should contain statement terminators"
-
-    def test_responsive_design_elements(self):
-        """Test that CSS includes responsive design elements."""
-        # Check for layout property usage, which is key to Textual's responsiveness
-        assert "layout:" in APP_CSS, "CSS should include layout properties for responsiveness"
-
-    def test_accessibility_considerations(self):
-        """Test that CSS includes accessibility considerations."""
-        # Check for contrast and readability keywords
-        accessibility_keywords = ['color', 'background', 'border']
-        has_accessibility = any(keyword in APP_CSS for keyword in accessibility_keywords)
-        assert has_accessibility, "CSS should include accessibility considerations"
-
-    def test_widget_specific_styles(self):
-        """Test that widget-specific styles are properly defined."""
-        # Check for ID and class selectors
-        has_id_selectors = '#' in APP_CSS
-        has_class_selectors = '.' in APP_CSS
-
-        # At least one type of selector should be present
-        assert has_id_selectors or has_class_selectors, "CSS should contain selectors for styling"
+        # Count every character once instead of scanning the string per check
+        chars = Counter(APP_CSS)
+
+        assert chars['{'] == chars['}'], "Unbalanced braces in APP_CSS"
+        assert chars[':'], "CSS should contain property declarations"
+        assert chars[';'], "CSS should contain statement terminators"
+        assert chars['#'] or chars['.'], "CSS should contain selectors for styling"
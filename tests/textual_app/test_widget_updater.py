@@ -10,18 +10,34 @@ from mud_agent.utils.textual_app.widget_updater import WidgetUpdater
 class TestWidgetUpdater:
     """Test cases for WidgetUpdater class."""
 
-    @pytest.fixture
-    def mock_app(self):
-        """Create a mock app for testing."""
+    @pytest.fixture(scope="module")
+    def _mock_app_template(self):
+        """Build the mock app once per module; mock_app resets it per test."""
         app = Mock()
-        app.query = Mock()
-        app.query.return_value = []
+        app.query = Mock(return_value=[])
         return app
 
     @pytest.fixture
-    def widget_updater(self, mock_app):
+    def mock_app(self, _mock_app_template):
+        """Create a mock app for testing."""
+        _mock_app_template.reset_mock()
+        _mock_app_template.query.return_value = []
+        return _mock_app_template
+
+    @pytest.fixture(scope="module")
+    def _widget_updater_template(self, _mock_app_template):
+        """Build one WidgetUpdater per module along with its initial attributes."""
+        updater = WidgetUpdater(_mock_app_template)
+        return updater, dict(vars(updater))
+
+    @pytest.fixture
+    def widget_updater(self, mock_app, _widget_updater_template):
         """Create a WidgetUpdater instance for testing."""
-        return WidgetUpdater(mock_app)
+        updater, initial_state = _widget_updater_template
+        # Drops methods tests replaced with mocks and resets the throttle state
+        vars(updater).clear()
+        vars(updater).update(initial_state)
+        return updater
 
     def test_init(self, mock_app):
         """Test WidgetUpdater initialization."""
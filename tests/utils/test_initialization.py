@@ -5,51 +5,118 @@ Tests for initialization functions.
 
 import pytest
 import asyncio
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
-import time
 
+from mud_agent.utils import initialization
 from mud_agent.utils.initialization import detect_welcome_banner, initialize_game_state
 
 
-class TestDetectWelcomeBanner:
-    """Test suite for detect_welcome_banner function."""
+class FakeClock:
+    """Virtual clock standing in for time.time() and asyncio.sleep().
 
-    @pytest.mark.asyncio
-    async def test_banner_detected_in_last_response(self):
-        """Test that banner is detected if already in last_response."""
-        agent = MagicMock()
-        agent.last_response = "Welcome to Aardwolf! Type 'help' for help."
+    sleep() advances the clock instead of waiting, then yields once to the
+    event loop so other tasks still get a turn.
+    """
 
-        result = await detect_welcome_banner(agent, timeout=1)
+    def __init__(self):
+        self.now = 0.0
+        self._real_sleep = asyncio.sleep
 
-        assert result is True
+    def time(self):
+        return self.now
 
-    @pytest.mark.asyncio
-    async def test_banner_detected_password_prompt(self):
-        """Test that password prompt is recognized as banner."""
-        agent = MagicMock()
-        agent.last_response = "Password: "
+    async def sleep(self, delay):
+        self.now += delay
+        await self._real_sleep(0)
 
-        result = await detect_welcome_banner(agent, timeout=1)
 
-        assert result is True
+async def _noop_send_command(*args, **kwargs):
+    """send_command stand-in for tests that never inspect its calls."""
+
+
+def _seq(*values):
+    """Return a function that hands back values in order, counting calls in .calls."""
+    remaining = iter(values)
+
+    def next_value(*args, **kwargs):
+        next_value.calls += 1
+        return next(remaining)
+
+    next_value.calls = 0
+    return next_value
+
+
+@pytest.fixture
+def agent_factory():
+    """Return a builder for plain agents with GMCP disabled and no response yet.
+
+    Keyword arguments override the default attributes.
+    """
+
+    def build(**attributes):
+        agent = SimpleNamespace(
+            last_response="",
+            client=SimpleNamespace(gmcp_enabled=False),
+            aardwolf_gmcp=None,
+            send_command=_noop_send_command,
+        )
+        vars(agent).update(attributes)
+        return agent
+
+    return build
 
+
+@pytest.fixture
+def fake_clock(monkeypatch):
+    """Run detect_welcome_banner's polling loop on a FakeClock."""
+    clock = FakeClock()
+    monkeypatch.setattr(asyncio, "sleep", clock.sleep)
+    # Only initialization's view of the time module is replaced
+    monkeypatch.setattr(initialization, "time", SimpleNamespace(time=clock.time))
+    return clock
+
+
+@pytest.fixture
+def gmcp_agent():
+    """Return a MagicMock agent with GMCP enabled; tests set the GMCP updates they need."""
+    agent = MagicMock()
+    agent.client.gmcp_enabled = True
+    agent.aardwolf_gmcp = MagicMock()
+    agent.aardwolf_gmcp.get_character_stats.return_value = {"name": "TestChar"}
+    agent.state_manager = MagicMock()
+    return agent
+
+
+class TestDetectWelcomeBanner:
+    """Test suite for detect_welcome_banner function."""
+
+    @pytest.mark.parametrize(
+        "last_response",
+        [
+            pytest.param("Welcome to Aardwolf! Type 'help' for help.", id="in-last-response"),
+            pytest.param("Password: ", id="password-prompt"),
+            pytest.param("Welcome back! Last login was yesterday.", id="login-success"),
+            pytest.param("WELCOME TO AARDWOLF! type 'HELP' for help.", id="case-insensitive"),
+            pytest.param(
+                "\nSome text before\nWelcome to Aardwolf MUD\nSome text after\n",
+                id="partial-match",
+            ),
+        ],
+    )
     @pytest.mark.asyncio
-    async def test_banner_detected_login_success(self):
-        """Test that login success message is recognized."""
-        agent = MagicMock()
-        agent.last_response = "Welcome back! Last login was yesterday."
+    async def test_banner_detected(self, agent_factory, last_response):
+        """Test that a banner, prompt or login message in last_response is detected."""
+        agent = agent_factory(last_response=last_response)
 
         result = await detect_welcome_banner(agent, timeout=1)
 
         assert result is True
 
     @pytest.mark.asyncio
-    async def test_no_response_eventually_succeeds(self):
+    async def test_no_response_eventually_succeeds(self, agent_factory, fake_clock):
         """Test that function succeeds even if response comes late."""
-        agent = MagicMock()
-        agent.send_command = AsyncMock()
-        agent.last_response = ""  # Empty initially
+        agent = agent_factory()  # last_response is empty initially
 
         # Start detection
         async def set_response_later():
@@ -78,186 +145,126 @@ class TestDetectWelcomeBanner:
 
         assert result is True
 
+    @pytest.mark.parametrize("timeout", [0.2, 60], ids=["short", "long"])
     @pytest.mark.asyncio
-    async def test_timeout_returns_true(self):
+    async def test_timeout_returns_true(self, agent_factory, fake_clock, timeout):
         """Test that timeout still returns True to allow continuation."""
-        agent = MagicMock()
-        agent.last_response = ""
-        agent.send_command = AsyncMock()
+        agent = agent_factory()
 
-        start = time.time()
-        result = await detect_welcome_banner(agent, timeout=0.2)
-        duration = time.time() - start
+        result = await detect_welcome_banner(agent, timeout=timeout)
 
         assert result is True
-        assert duration >= 0.2
-        assert duration < 0.5  # Should not wait much longer than timeout
+        # Measured on the fake clock, so these bounds cost no real time
+        assert fake_clock.now >= timeout
+        assert fake_clock.now < timeout + 0.3  # Should not wait much longer than timeout
 
     @pytest.mark.asyncio
-    async def test_exception_returns_true(self):
+    async def test_exception_returns_true(self, agent_factory, fake_clock):
         """Test that exceptions don't break initialization flow."""
-        agent = MagicMock()
-        agent.send_command = AsyncMock(side_effect=Exception("Test error"))
+        agent = agent_factory(send_command=AsyncMock(side_effect=Exception("Test error")))
 
         result = await detect_welcome_banner(agent, timeout=0.5)
 
         # Should still return True to allow continuation
         assert result is True
 
-    @pytest.mark.asyncio
-    async def test_case_insensitive_pattern_matching(self):
-        """Test that banner patterns are case-insensitive."""
-        agent = MagicMock()
-        agent.last_response = "WELCOME TO AARDWOLF! type 'HELP' for help."
-
-        result = await detect_welcome_banner(agent, timeout=1)
-
-        assert result is True
-
-    @pytest.mark.asyncio
-    async def test_partial_pattern_matching(self):
-        """Test that partial patterns in larger text are detected."""
-        agent = MagicMock()
-        agent.last_response = """
-        Some text before
-        Welcome to Aardwolf MUD
-        Some text after
-        """
-
-        result = await detect_welcome_banner(agent, timeout=1)
-
-        assert result is True
-
 
 class TestInitializeGameState:
     """Test suite for initialize_game_state function."""
 
     @pytest.mark.asyncio
-    async def test_successful_gmcp_initialization(self):
+    async def test_successful_gmcp_initialization(self, gmcp_agent):
         """Test successful initialization using GMCP."""
-        agent = MagicMock()
-        agent.client = MagicMock()
-        agent.client.gmcp_enabled = True
-        agent.aardwolf_gmcp = MagicMock()
-        agent.aardwolf_gmcp.update_from_gmcp.return_value = {
+        gmcp_agent.aardwolf_gmcp.update_from_gmcp.return_value = {
             "char": {"name": "TestChar", "hp": 100},
             "room": {"num": 1234, "name": "Test Room"},
             "map": {"data": "test_map_data"}
         }
-        agent.aardwolf_gmcp.get_character_stats.return_value = {
+        gmcp_agent.aardwolf_gmcp.get_character_stats.return_value = {
             "name": "TestChar",
             "hp": 100
         }
-        agent.state_manager = MagicMock()
 
-        result = await initialize_game_state(agent)
+        result = await initialize_game_state(gmcp_agent)
 
         assert result is True
-        assert agent.aardwolf_gmcp.update_from_gmcp.called
-        assert agent.state_manager.update_from_aardwolf_gmcp.called
+        assert gmcp_agent.aardwolf_gmcp.update_from_gmcp.called
+        assert gmcp_agent.state_manager.update_from_aardwolf_gmcp.called
 
     @pytest.mark.asyncio
-    async def test_initialization_with_partial_gmcp_data(self):
+    async def test_initialization_with_partial_gmcp_data(self, gmcp_agent):
         """Test initialization when some GMCP data is missing initially."""
-        agent = MagicMock()
-        agent.client = MagicMock()
-        agent.client.gmcp_enabled = True
-        agent.aardwolf_gmcp = MagicMock()
-
         # First call returns only char data
         # Second call (after sleep) returns complete data
-        agent.aardwolf_gmcp.update_from_gmcp.side_effect = [
+        update_from_gmcp = _seq(
             {"char": {"name": "TestChar"}},
-            {"char": {"name": "TestChar"}, "room": {"num": 1234}}
-        ]
-        agent.aardwolf_gmcp.get_character_stats.return_value = {"name": "TestChar"}
-        agent.state_manager = MagicMock()
+            {"char": {"name": "TestChar"}, "room": {"num": 1234}},
+        )
+        gmcp_agent.aardwolf_gmcp.update_from_gmcp = update_from_gmcp
 
-        result = await initialize_game_state(agent)
+        result = await initialize_game_state(gmcp_agent)
 
         assert result is True
         # Should be called twice (initial + retry)
-        assert agent.aardwolf_gmcp.update_from_gmcp.call_count == 2
+        assert update_from_gmcp.calls == 2
 
     @pytest.mark.asyncio
-    async def test_initialization_without_gmcp(self):
+    async def test_initialization_without_gmcp(self, gmcp_agent):
         """Test initialization when GMCP is not enabled."""
-        agent = MagicMock()
-        agent.client = MagicMock()
-        agent.client.gmcp_enabled = False
-        agent.aardwolf_gmcp = None
+        gmcp_agent.client.gmcp_enabled = False
+        gmcp_agent.aardwolf_gmcp = None
 
-        result = await initialize_game_state(agent)
+        result = await initialize_game_state(gmcp_agent)
 
         # Should still return True to allow continuation
         assert result is True
 
     @pytest.mark.asyncio
-    async def test_initialization_gmcp_exception(self):
+    async def test_initialization_gmcp_exception(self, gmcp_agent):
         """Test that GMCP exceptions are handled gracefully."""
-        agent = MagicMock()
-        agent.client = MagicMock()
-        agent.client.gmcp_enabled = True
-        agent.aardwolf_gmcp = MagicMock()
-        agent.aardwolf_gmcp.update_from_gmcp.side_effect = Exception("GMCP error")
+        gmcp_agent.aardwolf_gmcp.update_from_gmcp.side_effect = Exception("GMCP error")
 
-        result = await initialize_game_state(agent)
+        result = await initialize_game_state(gmcp_agent)
 
         # Should return False on exception
         assert result is False
 
     @pytest.mark.asyncio
-    async def test_state_manager_update_with_char_data(self):
+    async def test_state_manager_update_with_char_data(self, gmcp_agent):
         """Test that state manager is updated when char data is present."""
-        agent = MagicMock()
-        agent.client = MagicMock()
-        agent.client.gmcp_enabled = True
-        agent.aardwolf_gmcp = MagicMock()
-        agent.aardwolf_gmcp.update_from_gmcp.return_value = {
+        gmcp_agent.aardwolf_gmcp.update_from_gmcp.return_value = {
             "char": {"name": "TestChar", "level": 10},
             "room": {"num": 1234}
         }
         char_stats = {"name": "TestChar", "level": 10}
-        agent.aardwolf_gmcp.get_character_stats.return_value = char_stats
-        agent.state_manager = MagicMock()
+        gmcp_agent.aardwolf_gmcp.get_character_stats.return_value = char_stats
 
-        result = await initialize_game_state(agent)
+        result = await initialize_game_state(gmcp_agent)
 
         assert result is True
-        agent.state_manager.update_from_aardwolf_gmcp.assert_called_with(char_stats)
+        gmcp_agent.state_manager.update_from_aardwolf_gmcp.assert_called_with(char_stats)
 
     @pytest.mark.asyncio
-    async def test_initialization_logs_gmcp_usage(self):
+    async def test_initialization_logs_gmcp_usage(self, gmcp_agent):
         """Test that GMCP usage is logged correctly."""
-        agent = MagicMock()
-        agent.client = MagicMock()
-        agent.client.gmcp_enabled = True
-        agent.aardwolf_gmcp = MagicMock()
-        agent.aardwolf_gmcp.update_from_gmcp.return_value = {
+        gmcp_agent.aardwolf_gmcp.update_from_gmcp.return_value = {
             "char": {"name": "TestChar"},
             "room": {"num": 1234}
         }
-        agent.aardwolf_gmcp.get_character_stats.return_value = {"name": "TestChar"}
-        agent.state_manager = MagicMock()
 
         with patch('mud_agent.utils.initialization.logger') as mock_logger:
-            result = await initialize_game_state(agent)
+            result = await initialize_game_state(gmcp_agent)
 
             assert result is True
             # Check that debug logging occurred
             assert mock_logger.debug.called
 
     @pytest.mark.asyncio
-    async def test_empty_gmcp_updates(self):
+    async def test_empty_gmcp_updates(self, gmcp_agent):
         """Test handling of empty GMCP updates."""
-        agent = MagicMock()
-        agent.client = MagicMock()
-        agent.client.gmcp_enabled = True
-        agent.aardwolf_gmcp = MagicMock()
-        agent.aardwolf_gmcp.update_from_gmcp.return_value = {}
-        agent.state_manager = MagicMock()
+        gmcp_agent.aardwolf_gmcp.update_from_gmcp.return_value = {}
 
-        result = await initialize_game_state(agent)
+        result = await initialize_game_state(gmcp_agent)
 
         # Should still return True even with empty updates
         assert result is True
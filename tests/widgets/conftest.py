@@ -0,0 +1,54 @@
+"""
+Shared fixtures for the widget tests.
+"""
+
+import re
+from unittest.mock import MagicMock
+
+import pytest
+
+from mud_agent.utils.widgets.room_widgets import RoomWidget
+
+
+@pytest.fixture
+def widget():
+    """Return an unmounted RoomWidget with write and refresh stubbed out."""
+    room_widget = RoomWidget()
+    room_widget.write = MagicMock()
+    room_widget.refresh = MagicMock()
+    return room_widget
+
+
+# Rich markup tags such as [bold yellow] or [/dim]
+_MARKUP_TAG_RE = re.compile(r"\[/?[a-z][^\]]*\]")
+
+
+class RichLogRecorder:
+    """Stand-in for RichLog.write that records lines and indexes them by label.
+
+    A line's label is its plain text up to the first colon, so
+    "[bold yellow]Exits: n, s[/bold yellow]" is filed under "Exits" and
+    "[dim]No NPCs present[/dim]" under "No NPCs present".
+    """
+
+    def __init__(self):
+        self.lines = []
+        self.by_label = {}
+
+    def write(self, text):
+        self.lines.append(text)
+        label = _MARKUP_TAG_RE.sub("", text).split(":", 1)[0].strip()
+        self.by_label.setdefault(label, []).append(text)
+
+    def first(self, label):
+        """Return the first line written under label, or None."""
+        lines = self.by_label.get(label)
+        return lines[0] if lines else None
+
+
+@pytest.fixture
+def recorder(widget):
+    """Route the widget's write() calls into a RichLogRecorder."""
+    log = RichLogRecorder()
+    widget.write = log.write
+    return log
@@ -1,7 +1,9 @@
 import pytest
 from textual.app import App
+from textual.containers import Grid
 
 from mud_agent.utils.widgets.mapper_container import MapperContainer
+from mud_agent.utils.widgets.room_map_widget import RoomMapWidget
 
 
 class MapperContainerApp(App):
@@ -9,9 +11,15 @@ class MapperContainerApp(App):
         yield MapperContainer()
 
 
+@pytest.mark.xdist_group("textual")
 @pytest.mark.asyncio
 async def test_initial_state():
-    """Test that MapperContainer can be mounted and queried."""
+    """Test that MapperContainer mounts and on_mount fills each level's grid."""
     app = MapperContainerApp()
     async with app.run_test() as pilot:
-        assert pilot.app.query_one(MapperContainer)
+        await pilot.pause()
+        container = pilot.app.query_one(MapperContainer)
+        for z in MapperContainer.LEVELS:
+            grid = container.query_one(f"#map-grid-z{z}", Grid)
+            cells = grid.query(RoomMapWidget)
+            assert len(cells) == MapperContainer.GRID_ROWS * MapperContainer.GRID_COLS
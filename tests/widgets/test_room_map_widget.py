@@ -3,23 +3,34 @@ from rich.text import Text
 
 from mud_agent.utils.widgets.room_map_widget import RoomMapWidget
 
+# What a widget renders when it has no room to draw
+_EXPECTED_DOT = Text("  .  ", justify="center")
 
-@pytest.fixture
-def room_widget():
-    """Provides a fresh RoomMapWidget for each test."""
+
+@pytest.fixture(scope="module")
+def _shared_room_widget():
+    """Build one unmounted RoomMapWidget for the whole module."""
     return RoomMapWidget()
 
 
+@pytest.fixture
+def room_widget(_shared_room_widget):
+    """Provides the shared RoomMapWidget, reset to an empty non-current room."""
+    _shared_room_widget.room_data = {}
+    _shared_room_widget.is_current = False
+    return _shared_room_widget
+
+
 def test_render_no_room_data(room_widget):
     """Tests that a widget with no room data renders a dot."""
     room_widget.room_data = {}
-    assert room_widget.render() == Text("  .  ", justify="center")
+    assert room_widget.render() == _EXPECTED_DOT
 
 
 def test_render_no_room_num(room_widget):
     """Tests that a widget with no room number renders a dot."""
     room_widget.room_data = {"exits": {"n": 1}}
-    assert room_widget.render() == Text("  .  ", justify="center")
+    assert room_widget.render() == _EXPECTED_DOT
 
 
 def test_render_current_room(room_widget):
@@ -27,14 +38,14 @@ def test_render_current_room(room_widget):
     room_widget.is_current = True
     room_widget.room_data = {"num": 1, "exits": {"n": 2, "w": 3}}
     expected_grid = "  |  \n-[@] \n     "
-    assert room_widget.render().plain == expected_grid.replace("\\n", "\n")
+    assert room_widget.render().plain == expected_grid
 
 
 def test_render_no_exits(room_widget):
     """Tests that a room with no exits renders as '[#]' in the center."""
     room_widget.room_data = {"num": 1, "exits": {}}
     expected_grid = "     \n [#] \n     "
-    assert room_widget.render().plain == expected_grid.replace("\\n", "\n")
+    assert room_widget.render().plain == expected_grid
 
 
 @pytest.mark.parametrize(
@@ -69,7 +80,7 @@ def test_render_no_exits(room_widget):
 def test_render_exits(room_widget, exits, expected_grid):
     """Tests rendering of all combinations of exits."""
     room_widget.room_data = {"num": 1, "exits": exits}
-    assert room_widget.render().plain == expected_grid.replace("\\n", "\n")
+    assert room_widget.render().plain == expected_grid
 
 
 def test_current_room_precedence(room_widget):
@@ -78,4 +89,4 @@ def test_current_room_precedence(room_widget):
     exits = {"u": 1, "n": 2, "w": 3}
     room_widget.room_data = {"num": 1, "exits": exits}
     expected_grid = "  | /\n-[@] \n     "
-    assert room_widget.render().plain == expected_grid.replace("\\n", "\n")
+    assert room_widget.render().plain == expected_grid
@@ -4,7 +4,6 @@ Tests for RoomWidget to ensure proper display of room information and exits.
 """
 
 import pytest
-from unittest.mock import MagicMock, patch
 from textual.app import App
 
 from mud_agent.utils.widgets.room_widgets import RoomWidget
@@ -20,10 +19,8 @@ class RoomWidgetTestApp(App):
 class TestRoomWidget:
     """Test suite for RoomWidget."""
 
-    def test_room_widget_initialization(self):
+    def test_room_widget_initialization(self, widget):
         """Test RoomWidget initializes with default values."""
-        widget = RoomWidget()
-
         assert widget.room_name == "Unknown"
         assert widget.room_num == 0
         assert widget.area_name == "Unknown"
@@ -35,158 +32,49 @@ class TestRoomWidget:
         assert widget.last_room_num == 0
         assert widget.first_update is True
 
-    def test_exits_display_with_room_numbers(self):
-        """Test that exits are displayed with room numbers in parentheses."""
-        widget = RoomWidget()
-
-        # Set up exits as a dictionary with room numbers
-        widget.exits = {
-            "n": 1234,
-            "s": 1235,
-            "e": 1236,
-            "w": 1237
-        }
-
-        # Mock the write method to capture output
-        written_lines = []
-        widget.write = MagicMock(side_effect=lambda text: written_lines.append(text))
-
-        # Call update_content
-        widget.update_content()
-
-        # Find the exits line
-        exits_line = None
-        for line in written_lines:
-            if "Exits:" in line:
-                exits_line = line
-                break
-
-        assert exits_line is not None, "Exits line not found in output"
-
-        # Check that room numbers are in parentheses
-        assert "(1234)" in exits_line
-        assert "(1235)" in exits_line
-        assert "(1236)" in exits_line
-        assert "(1237)" in exits_line
-
-    def test_exits_display_without_room_numbers(self):
-        """Test that exits without room numbers are displayed without parentheses."""
-        widget = RoomWidget()
-
-        # Set up exits as a dictionary without room numbers (None values)
-        widget.exits = {
-            "n": None,
-            "s": None,
-            "e": None,
-            "w": None
-        }
-
-        # Mock the write method to capture output
-        written_lines = []
-        widget.write = MagicMock(side_effect=lambda text: written_lines.append(text))
+    @pytest.mark.parametrize(
+        "exits, label, expected_substrings, expected_absent",
+        [
+            pytest.param(
+                {"n": 1234, "s": 1235, "e": 1236, "w": 1237},
+                "Exits",
+                ["(1234)", "(1235)", "(1236)", "(1237)"],
+                [],
+                id="with-room-numbers",
+            ),
+            pytest.param(
+                {"n": None, "s": None, "e": None, "w": None},
+                "Exits",
+                ["n", "s", "e", "w"],
+                ["("],
+                id="without-room-numbers",
+            ),
+            pytest.param(
+                {"n": 1234, "s": None, "e": 1236, "w": None},
+                "Exits",
+                ["(1234)", "(1236)"],
+                [],
+                id="mixed-room-numbers",
+            ),
+            pytest.param(["n", "s", "e", "w"], "Exits", ["n", "s", "e", "w"], [], id="as-list"),
+            pytest.param([], "No visible exits", [], [], id="no-exits"),
+        ],
+    )
+    def test_exits_display(self, widget, recorder, exits, label, expected_substrings, expected_absent):
+        """Test that exits are displayed, with room numbers in parentheses where known."""
+        widget.exits = exits
 
-        # Call update_content
         widget.update_content()
 
-        # Find the exits line
-        exits_line = None
-        for line in written_lines:
-            if "Exits:" in line:
-                exits_line = line
-                break
-
-        assert exits_line is not None, "Exits line not found in output"
-
-        # Check that directions are present without parentheses for None values
-        assert "n" in exits_line
-        assert "s" in exits_line
-        assert "e" in exits_line
-        assert "w" in exits_line
-
-    def test_exits_display_mixed_room_numbers(self):
-        """Test that exits with mixed room numbers (some None) are displayed correctly."""
-        widget = RoomWidget()
-
-        # Set up exits with mixed room numbers
-        widget.exits = {
-            "n": 1234,
-            "s": None,
-            "e": 1236,
-            "w": None
-        }
-
-        # Mock the write method to capture output
-        written_lines = []
-        widget.write = MagicMock(side_effect=lambda text: written_lines.append(text))
-
-        # Call update_content
-        widget.update_content()
-
-        # Find the exits line
-        exits_line = None
-        for line in written_lines:
-            if "Exits:" in line:
-                exits_line = line
-                break
-
-        assert exits_line is not None, "Exits line not found in output"
+        exits_line = recorder.first(label)
+        assert exits_line is not None, f"{label!r} line not found in output"
+        for expected in expected_substrings:
+            assert expected in exits_line
+        for absent in expected_absent:
+            assert absent not in exits_line
 
-        # Check that room numbers are in parentheses where present
-        assert "(1234)" in exits_line
-        assert "(1236)" in exits_line
-        # Directions without room numbers should not have parentheses after them
-        # The line should contain "s" and "w" without numbers
-
-    def test_exits_display_as_list(self):
-        """Test that exits as a list are displayed correctly (no room numbers)."""
-        widget = RoomWidget()
-
-        # Set up exits as a list
-        widget.exits = ["n", "s", "e", "w"]
-
-        # Mock the write method to capture output
-        written_lines = []
-        widget.write = MagicMock(side_effect=lambda text: written_lines.append(text))
-
-        # Call update_content
-        widget.update_content()
-
-        # Find the exits line
-        exits_line = None
-        for line in written_lines:
-            if "Exits:" in line:
-                exits_line = line
-                break
-
-        assert exits_line is not None, "Exits line not found in output"
-
-        # Check that all directions are present
-        assert "n" in exits_line
-        assert "s" in exits_line
-        assert "e" in exits_line
-        assert "w" in exits_line
-
-    def test_no_exits_display(self):
-        """Test that 'No visible exits' is displayed when there are no exits."""
-        widget = RoomWidget()
-
-        # Set up with no exits
-        widget.exits = []
-
-        # Mock the write method to capture output
-        written_lines = []
-        widget.write = MagicMock(side_effect=lambda text: written_lines.append(text))
-
-        # Call update_content
-        widget.update_content()
-
-        # Check for "No visible exits" message
-        assert any("No visible exits" in line for line in written_lines)
-
-    def test_room_info_display(self):
+    def test_room_info_display(self, widget, recorder):
         """Test that room information is displayed correctly."""
-        widget = RoomWidget()
-
         # Set up room information
         widget.room_name = "Test Room"
         widget.room_num = 12345
@@ -195,15 +83,11 @@ class TestRoomWidget:
         widget.room_details = "well lit"
         widget.room_coords = {"x": 10, "y": 20, "cont": 0}
 
-        # Mock the write method to capture output
-        written_lines = []
-        widget.write = MagicMock(side_effect=lambda text: written_lines.append(text))
-
         # Call update_content
         widget.update_content()
 
         # Verify room information is in the output
-        output_text = " ".join(written_lines)
+        output_text = " ".join(recorder.lines)
         assert "Test Room" in output_text
         assert "12345" in output_text
         assert "Test Area" in output_text
@@ -212,53 +96,35 @@ class TestRoomWidget:
         assert "X=10" in output_text
         assert "Y=20" in output_text
 
-    def test_npcs_display(self):
+    def test_npcs_display(self, widget, recorder):
         """Test that NPCs are displayed correctly."""
-        widget = RoomWidget()
-
         # Set up NPCs
         widget.npcs = ["Guard", "Merchant", "Beggar"]
 
-        # Mock the write method to capture output
-        written_lines = []
-        widget.write = MagicMock(side_effect=lambda text: written_lines.append(text))
-
         # Call update_content
         widget.update_content()
 
         # Find the NPCs line
-        npcs_line = None
-        for line in written_lines:
-            if "NPCs:" in line:
-                npcs_line = line
-                break
+        npcs_line = recorder.first("NPCs")
 
         assert npcs_line is not None, "NPCs line not found in output"
         assert "Guard" in npcs_line
         assert "Merchant" in npcs_line
         assert "Beggar" in npcs_line
 
-    def test_no_npcs_display(self):
+    def test_no_npcs_display(self, widget, recorder):
         """Test that 'No NPCs present' is displayed when there are no NPCs."""
-        widget = RoomWidget()
-
         # Set up with no NPCs
         widget.npcs = []
 
-        # Mock the write method to capture output
-        written_lines = []
-        widget.write = MagicMock(side_effect=lambda text: written_lines.append(text))
-
         # Call update_content
         widget.update_content()
 
         # Check for "No NPCs present" message
-        assert any("No NPCs present" in line for line in written_lines)
+        assert recorder.first("No NPCs present") is not None
 
-    def test_room_update_event_handling(self):
+    def test_room_update_event_handling(self, widget, recorder):
         """Test that _on_room_update properly updates widget state."""
-        widget = RoomWidget()
-
         # Create update data
         updates = {
             "brief": "Updated Room",
@@ -271,10 +137,6 @@ class TestRoomWidget:
             "npcs": ["Dragon"]
         }
 
-        # Mock the write method
-        widget.write = MagicMock()
-        widget.refresh = MagicMock()
-
         # Call _on_room_update
         widget._on_room_update(room_data=updates)
 
@@ -289,10 +151,11 @@ class TestRoomWidget:
         assert widget.npcs == ["Dragon"]
 
         # Verify update_content was called (via write being called)
-        assert widget.write.called
+        assert recorder.lines
         assert widget.refresh.called
 
 
+@pytest.mark.xdist_group("textual")
 @pytest.mark.asyncio
 async def test_room_widget_in_app():
     """Test RoomWidget in a Textual app context."""
@@ -1,38 +1,110 @@
 """Tests for widgets state_listener module."""
 
-from unittest.mock import AsyncMock, Mock, patch
+import asyncio
+from types import SimpleNamespace
 
 import pytest
 from textual.widgets import Static
 
 from mud_agent.utils.widgets.state_listener import StateListener
 
+# State keys the multi-key subscription tests subscribe to
+_KEYS = ("character.vitals", "character.stats", "room.info")
+_KEYS_SET = frozenset(_KEYS)
+
+
+class _FakeStatic:
+    """Stand-in for Static; the StateListener tests never mount the widget."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__()
+
+
+class MockWidget(_FakeStatic, StateListener):
+    """Widget with the StateListener mixin, defined once for all tests."""
+
+    def __init__(self):
+        # _FakeStatic chains to StateListener.__init__ through the MRO
+        super().__init__()
+        self.id = "test_widget"
+        self.updates = []
+
+    def update_display(self, data):
+        """Record the data passed to update_display."""
+        self.updates.append(data)
+
+
+class StaticListenerWidget(Static, StateListener):
+    """Real Static widget with the StateListener mixin."""
+
+    def update_display(self, data):
+        pass
+
+
+class IncompleteWidget(StateListener):
+    """StateListener subclass that leaves update_display unimplemented."""
+
+    def __init__(self):
+        self.id = "test_widget"
+        super().__init__()
+
+
+class StubStateManager:
+    """Records the state manager calls StateListener makes."""
+
+    __slots__ = ("state", "get_state_calls", "register_calls", "unregister_calls")
+
+    def __init__(self, state=None):
+        self.state = state
+        self.get_state_calls = []
+        self.register_calls = []
+        self.unregister_calls = []
+
+    def get_state(self, state_key):
+        self.get_state_calls.append(state_key)
+        return self.state
+
+    def register_listener(self, listener_id, callback):
+        self.register_calls.append((listener_id, callback))
+
+    def unregister_listener(self, listener_id):
+        self.unregister_calls.append(listener_id)
+
 
 class TestStateListener:
     """Test cases for StateListener mixin class."""
 
-    @pytest.fixture
-    def mock_widget(self):
-        """Create a mock widget with StateListener mixin."""
-        class MockWidget(Static, StateListener):
-            def __init__(self):
-                super().__init__()
-                StateListener.__init__(self)
-                self.id = "test_widget"
-
-            def update_display(self, data):
-                """Mock update display method."""
-                pass
+    @pytest.fixture(scope="module")
+    def _shared_mock_widget(self):
+        """Build one MockWidget for the module; each xdist worker builds its own."""
+        return MockWidget()
 
-        widget = MockWidget()
-        widget.state_manager = Mock()
+    @pytest.fixture
+    def mock_widget(self, _shared_mock_widget):
+        """Provide the shared mock widget, reset to a fresh StateListener state."""
+        widget = _shared_mock_widget
+        widget.clear_subscriptions()
+        widget.updates.clear()
+        widget.state_manager = StubStateManager()
+        # Drop instance-level overrides, such as an async update_display
+        vars(widget).pop("update_display", None)
         return widget
 
     def test_state_listener_init(self, mock_widget):
         """Test StateListener initialization."""
-        assert hasattr(mock_widget, 'state_manager')
-        assert hasattr(mock_widget, 'subscribed_keys')
-        assert isinstance(mock_widget.subscribed_keys, set)
+        assert "state_manager" in vars(mock_widget)
+        assert mock_widget.subscribed_keys == frozenset()
+        assert mock_widget.get_subscribed_keys() == ()
+
+    def test_subscribed_keys_is_read_only(self, mock_widget):
+        """Test that subscribed_keys cannot be replaced or mutated in place."""
+        mock_widget.subscribe_to_state("character.vitals")
+
+        with pytest.raises(AttributeError):
+            mock_widget.subscribed_keys = set()
+        with pytest.raises(AttributeError):
+            mock_widget.subscribed_keys.add("room.info")
+        assert mock_widget.get_subscribed_keys() == ("character.vitals",)
 
     def test_subscribe_to_state(self, mock_widget):
         """Test subscribing to state updates."""
@@ -42,13 +114,9 @@ class TestStateListener:
 
     def test_subscribe_multiple_keys(self, mock_widget):
         """Test subscribing to multiple state keys."""
-        keys = ["character.vitals", "character.stats", "room.info"]
-        for key in keys:
-            mock_widget.subscribe_to_state(key)
+        mock_widget.subscribe_to_states(_KEYS)
 
-        for key in keys:
-            assert key in mock_widget.subscribed_keys
-        assert len(mock_widget.subscribed_keys) == 3
+        assert mock_widget.subscribed_keys == _KEYS_SET
 
     def test_unsubscribe_from_state(self, mock_widget):
         """Test unsubscribing from state updates."""
@@ -68,24 +136,25 @@ class TestStateListener:
 
     def test_clear_subscriptions(self, mock_widget):
         """Test clearing all subscriptions."""
-        keys = ["character.vitals", "character.stats", "room.info"]
-        for key in keys:
-            mock_widget.subscribe_to_state(key)
+        mock_widget.subscribe_to_states(_KEYS)
 
-        assert len(mock_widget.subscribed_keys) == 3
+        assert len(mock_widget.subscribed_keys) == len(_KEYS)
         mock_widget.clear_subscriptions()
         assert len(mock_widget.subscribed_keys) == 0
 
-    def test_on_state_update_subscribed_key(self, mock_widget):
-        """Test handling state update for subscribed key."""
+    @pytest.mark.parametrize(
+        "test_data",
+        [{"hp": 100, "mp": 50}, None, {}],
+        ids=["dict-data", "none-data", "empty-data"],
+    )
+    def test_on_state_update_subscribed_key(self, mock_widget, test_data):
+        """Test handling state update for subscribed key, whatever the data."""
         state_key = "character.vitals"
-        test_data = {"hp": 100, "mp": 50}
 
         mock_widget.subscribe_to_state(state_key)
 
-        with patch.object(mock_widget, 'update_display') as mock_update:
-            mock_widget.on_state_update(state_key, test_data)
-            mock_update.assert_called_once_with(test_data)
+        mock_widget.on_state_update(state_key, test_data)
+        assert mock_widget.updates == [test_data]
 
     def test_on_state_update_unsubscribed_key(self, mock_widget):
         """Test handling state update for unsubscribed key."""
@@ -94,39 +163,19 @@ class TestStateListener:
 
         # Don't subscribe to the key
 
-        with patch.object(mock_widget, 'update_display') as mock_update:
-            mock_widget.on_state_update(state_key, test_data)
-            mock_update.assert_not_called()
-
-    def test_on_state_update_with_none_data(self, mock_widget):
-        """Test handling state update with None data."""
-        state_key = "character.vitals"
-        mock_widget.subscribe_to_state(state_key)
-
-        with patch.object(mock_widget, 'update_display') as mock_update:
-            mock_widget.on_state_update(state_key, None)
-            mock_update.assert_called_once_with(None)
-
-    def test_on_state_update_with_empty_data(self, mock_widget):
-        """Test handling state update with empty data."""
-        state_key = "character.vitals"
-        empty_data = {}
-        mock_widget.subscribe_to_state(state_key)
-
-        with patch.object(mock_widget, 'update_display') as mock_update:
-            mock_widget.on_state_update(state_key, empty_data)
-            mock_update.assert_called_once_with(empty_data)
+        mock_widget.on_state_update(state_key, test_data)
+        assert mock_widget.updates == []
 
     def test_get_state_data(self, mock_widget):
         """Test getting current state data."""
         state_key = "character.vitals"
         expected_data = {"hp": 100, "mp": 50}
 
-        mock_widget.state_manager.get_state.return_value = expected_data
+        mock_widget.state_manager.state = expected_data
 
         result = mock_widget.get_state_data(state_key)
         assert result == expected_data
-        mock_widget.state_manager.get_state.assert_called_once_with(state_key)
+        assert mock_widget.state_manager.get_state_calls == [state_key]
 
     def test_get_state_data_no_state_manager(self, mock_widget):
         """Test getting state data when no state manager is available."""
@@ -140,28 +189,25 @@ class TestStateListener:
     def test_register_with_state_manager(self, mock_widget):
         """Test registering widget with state manager."""
         mock_widget.register_with_state_manager()
-        mock_widget.state_manager.register_listener.assert_called_once_with(
-            mock_widget.id, mock_widget.on_state_update
-        )
+        assert mock_widget.state_manager.register_calls == [
+            (mock_widget.id, mock_widget.on_state_update)
+        ]
+
+    @pytest.mark.parametrize(
+        "method", ["register_with_state_manager", "unregister_from_state_manager"]
+    )
+    def test_state_manager_methods_no_manager(self, mock_widget, method):
+        """Test (un)registering when no state manager is available."""
+        mock_widget.state_manager = None
 
-    def test_register_with_state_manager_no_manager(self, mock_widget):
-        """Test registering when no state manager is available."""
         # Should not raise an error
-        mock_widget.register_with_state_manager()
+        getattr(mock_widget, method)()
+        assert mock_widget.state_manager is None
 
     def test_unregister_from_state_manager(self, mock_widget):
         """Test unregistering widget from state manager."""
         mock_widget.unregister_from_state_manager()
-        mock_widget.state_manager.unregister_listener.assert_called_once_with(
-            mock_widget.id
-        )
-
-    def test_unregister_from_state_manager_no_manager(self, mock_widget):
-        """Test unregistering when no state manager is available."""
-        mock_widget.state_manager = None
-
-        # Should not raise an error
-        mock_widget.unregister_from_state_manager()
+        assert mock_widget.state_manager.unregister_calls == [mock_widget.id]
 
     def test_is_subscribed_to(self, mock_widget):
         """Test checking if subscribed to a state key."""
@@ -176,50 +222,55 @@ class TestStateListener:
         assert not mock_widget.is_subscribed_to(state_key)
 
     def test_get_subscribed_keys(self, mock_widget):
-        """Test getting list of subscribed keys."""
-        keys = ["character.vitals", "character.stats", "room.info"]
-
-        for key in keys:
-            mock_widget.subscribe_to_state(key)
+        """Test getting the subscribed keys."""
+        mock_widget.subscribe_to_states(_KEYS)
 
         subscribed = mock_widget.get_subscribed_keys()
-        assert isinstance(subscribed, list)
-        assert set(subscribed) == set(keys)
+        assert isinstance(subscribed, tuple)
+        assert frozenset(subscribed) == _KEYS_SET
+        # The cached view is reused until the subscriptions change
+        assert mock_widget.get_subscribed_keys() is subscribed
+
+        mock_widget.unsubscribe_from_state(_KEYS[0])
+        assert frozenset(mock_widget.get_subscribed_keys()) == _KEYS_SET - {_KEYS[0]}
 
     def test_update_display_not_implemented(self):
         """Test that StateListener requires update_display to be implemented."""
+        widget = IncompleteWidget()
         with pytest.raises(NotImplementedError):
-
-            class IncompleteWidget(StateListener):
-
-                def __init__(self):
-                    self.id = "test_widget"
-                    super().__init__()
-
-            widget = IncompleteWidget()
             widget.update_display(None)
 
-    @pytest.mark.asyncio
-    async def test_async_state_update(self, mock_widget):
+    def test_async_state_update(self, mock_widget):
         """Test handling asynchronous state updates."""
         state_key = "character.vitals"
         test_data = {"hp": 100, "mp": 50}
 
         mock_widget.subscribe_to_state(state_key)
 
-        # Mock async update_display
-        mock_widget.update_display = AsyncMock()
+        # Async update_display that records what it was awaited with
+        awaited = []
 
-        await mock_widget.on_state_update_async(state_key, test_data)
-        mock_widget.update_display.assert_called_once_with(test_data)
+        async def update_display(data):
+            awaited.append(data)
 
-    def test_state_listener_inheritance(self, mock_widget):
-        """Test that StateListener can be properly inherited."""
-        assert isinstance(mock_widget, StateListener)
-        assert hasattr(mock_widget, 'subscribe_to_state')
-        assert hasattr(mock_widget, 'unsubscribe_from_state')
-        assert hasattr(mock_widget, 'on_state_update')
-        assert hasattr(mock_widget, 'get_state_data')
+        mock_widget.update_display = update_display
+
+        # The only coroutine in the module, so run it directly rather than
+        # through a pytest-asyncio managed loop
+        asyncio.run(mock_widget.on_state_update_async(state_key, test_data))
+        assert awaited == [test_data]
+
+    def test_state_listener_inheritance(self):
+        """Test that StateListener can be properly inherited by a Textual widget."""
+        widget = StaticListenerWidget()
+        assert isinstance(widget, Static)
+        assert isinstance(widget, StateListener)
+        assert {
+            "subscribe_to_state",
+            "unsubscribe_from_state",
+            "on_state_update",
+            "get_state_data",
+        } <= set(dir(widget))
 
     def test_multiple_inheritance_compatibility(self):
         """Test StateListener works with multiple inheritance."""
@@ -231,15 +282,14 @@ class TestStateListener:
             def __init__(self):
                 super().__init__()
                 self.id = "test_widget"
-                self.app = Mock()
-                self.app.state_manager = Mock()
+                self.app = SimpleNamespace(state_manager=SimpleNamespace())
                 StateListener.__init__(self)
 
             def update_display(self, data):
                 pass
 
         widget = MultipleInheritanceWidget()
-        assert hasattr(widget, 'base_attr')
-        assert hasattr(widget, 'subscribed_keys')
+        assert widget.base_attr == "base"
+        assert widget.subscribed_keys == frozenset()
         assert isinstance(widget, StateListener)
         assert isinstance(widget, MockBase)